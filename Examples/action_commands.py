@@ -26,6 +26,8 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 import sys
+import threading
+from queue import Empty, Queue
 from typing import Optional
 from vmbpy import *
 
@@ -73,42 +75,62 @@ def parse_args() -> Optional[str]:
     return cam_id if cam_id else None
 
 
-def get_input() -> str:
+def print_prompt():
     prompt = 'Press \'a\' to send action command. Press \'q\' to stop example. Enter:'
     print(prompt, flush=True)
-    return input()
 
 
-def get_camera(camera_id: Optional[str]) -> Camera:
-    with VmbSystem.get_instance() as vmb:
-        if camera_id:
-            try:
-                return vmb.get_camera_by_id(camera_id)
+def read_input(inputs: Queue):
+    # Runs on a separate thread, so waiting for user input never blocks the main loop. Closing
+    # stdin is treated like a request to stop the example
+    while True:
+        try:
+            inputs.put(input())
 
-            except VmbCameraError:
-                abort('Failed to access camera \'{}\'. Abort.'.format(camera_id))
+        except EOFError:
+            inputs.put('q')
+            return
 
-        else:
-            cams = vmb.get_all_cameras()
-            if not cams:
-                abort('No cameras accessible. Abort.')
 
-            return cams[0]
+def start_input_thread() -> Queue:
+    inputs: Queue = Queue()
+    threading.Thread(target=read_input, args=(inputs,), daemon=True).start()
+    return inputs
 
 
-def frame_handler(cam: Camera, stream: Stream, frame: Frame):
-    if frame.get_status() == FrameStatus.Complete:
-        print('Frame(ID: {}) has been received.'.format(frame.get_id()), flush=True)
+def get_camera(vmb: VmbSystem, camera_id: Optional[str]) -> Camera:
+    if camera_id:
+        try:
+            return vmb.get_camera_by_id(camera_id)
+
+        except VmbCameraError:
+            abort('Failed to access camera \'{}\'. Abort.'.format(camera_id))
 
+    else:
+        cams = vmb.get_all_cameras()
+        if not cams:
+            abort('No cameras accessible. Abort.')
+
+        return cams[0]
+
+
+def frame_handler(cam: Camera, stream: Stream, frame: Frame):
+    # Hand the buffer back to the camera before printing, so it is available again as soon as
+    # possible. Status and ID must be read first, they may change once the frame is queued
+    complete = frame.get_status() == FrameStatus.Complete
+    frame_id = frame.get_id()
     cam.queue_frame(frame)
 
+    if complete:
+        print('Frame(ID: {}) has been received.'.format(frame_id), flush=True)
+
 
 def main():
     print_preamble()
     camera_id = parse_args()
 
-    with VmbSystem.get_instance():
-        cam = get_camera(camera_id)
+    with VmbSystem.get_instance() as vmb:
+        cam = get_camera(vmb, camera_id)
         inter = cam.get_interface()
 
         with cam:
@@ -136,21 +158,41 @@ def main():
             except (AttributeError, VmbFeatureError):
                 abort('The selected camera does not seem to support action commands')
 
+            # Prepare interface for sending ActionCommands. The keys do not change while the
+            # example runs, so they are written once and only the command is run on user input.
+            # This keeps each action command down to a single feature access.
+            try:
+                inter.ActionDeviceKey.set(device_key)
+                inter.ActionGroupKey.set(group_key)
+                inter.ActionGroupMask.set(group_mask)
+                action_command = inter.ActionCommand
+            except (AttributeError, VmbFeatureError):
+                abort('The interface of the selected camera does not seem to support action '
+                      'commands')
+
             # Enter streaming mode and wait for user input.
             try:
-                cam.start_streaming(frame_handler)
+                # Frame buffers are allocated once by VmbPy when streaming starts and are reused for
+                # every action command until streaming is stopped
+                cam.start_streaming(frame_handler, allocation_mode=AllocationMode.AnnounceFrame)
+
+                inputs = start_input_thread()
+                print_prompt()
 
                 while True:
-                    ch = get_input()
+                    try:
+                        ch = inputs.get(timeout=0.1)
+
+                    except Empty:
+                        continue
 
                     if ch == 'q':
                         break
 
                     elif ch == 'a':
-                        inter.ActionDeviceKey.set(device_key)
-                        inter.ActionGroupKey.set(group_key)
-                        inter.ActionGroupMask.set(group_mask)
-                        inter.ActionCommand.run()
+                        action_command.run()
+
+                    print_prompt()
 
             finally:
                 cam.stop_streaming()
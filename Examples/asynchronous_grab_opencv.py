@@ -25,8 +25,11 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import sys
+import time
 from typing import Optional
-from queue import Queue
+from queue import Empty, Queue
+
+import numpy
 
 from vmbpy import *
 
@@ -34,6 +37,10 @@ from vmbpy import *
 # All frames will either be recorded in this format, or transformed to it before being displayed
 opencv_display_format = PixelFormat.Bgr8
 
+# Sets for fast membership tests when selecting the pixel format of a camera
+color_pixel_formats = frozenset(COLOR_PIXEL_FORMATS)
+mono_pixel_formats = frozenset(MONO_PIXEL_FORMATS)
+
 
 def print_preamble():
     print('///////////////////////////////////////////////////')
@@ -75,21 +82,28 @@ def parse_args() -> Optional[str]:
     return None if argc == 0 else args[0]
 
 
-def get_camera(camera_id: Optional[str]) -> Camera:
-    with VmbSystem.get_instance() as vmb:
-        if camera_id:
-            try:
-                return vmb.get_camera_by_id(camera_id)
+def get_camera(vmb: VmbSystem, camera_id: Optional[str]) -> Camera:
+    if camera_id:
+        try:
+            return vmb.get_camera_by_id(camera_id)
 
-            except VmbCameraError:
-                abort('Failed to access Camera \'{}\'. Abort.'.format(camera_id))
+        except VmbCameraError:
+            abort('Failed to access Camera \'{}\'. Abort.'.format(camera_id))
 
-        else:
-            cams = vmb.get_all_cameras()
-            if not cams:
-                abort('No Cameras accessible. Abort.')
+    else:
+        cams = vmb.get_all_cameras()
+        if not cams:
+            abort('No Cameras accessible. Abort.')
 
-            return cams[0]
+        return cams[0]
+
+
+def wait_feature_done(cmd_feat: CommandFeature, poll_ms: int = 1, timeout_s: float = 5.0):
+    # Sleep between polls instead of spinning, so waiting for the command does not occupy a full
+    # CPU core. Gives up silently after `timeout_s` seconds
+    deadline = time.monotonic() + timeout_s
+    while not cmd_feat.is_done() and time.monotonic() < deadline:
+        time.sleep(poll_ms / 1000)
 
 
 def setup_camera(cam: Camera):
@@ -112,23 +126,26 @@ def setup_camera(cam: Camera):
         try:
             stream = cam.get_streams()[0]
             stream.GVSPAdjustPacketSize.run()
-            while not stream.GVSPAdjustPacketSize.is_done():
-                pass
+            wait_feature_done(stream.GVSPAdjustPacketSize)
 
         except (AttributeError, VmbFeatureError):
             pass
 
 
+def is_convertible(fmt: PixelFormat) -> bool:
+    return opencv_display_format in fmt.get_convertible_formats()
+
+
 def setup_pixel_format(cam: Camera):
     # Query available pixel formats. Prefer color formats over monochrome formats
     cam_formats = cam.get_pixel_formats()
-    cam_color_formats = intersect_pixel_formats(cam_formats, COLOR_PIXEL_FORMATS)
-    convertible_color_formats = tuple(f for f in cam_color_formats
-                                      if opencv_display_format in f.get_convertible_formats())
+    # Formats are filtered in the order reported by the camera, so the choice below does not
+    # depend on set iteration order
+    convertible_color_formats = tuple(f for f in cam_formats
+                                      if f in color_pixel_formats and is_convertible(f))
 
-    cam_mono_formats = intersect_pixel_formats(cam_formats, MONO_PIXEL_FORMATS)
-    convertible_mono_formats = tuple(f for f in cam_mono_formats
-                                     if opencv_display_format in f.get_convertible_formats())
+    convertible_mono_formats = tuple(f for f in cam_formats
+                                     if f in mono_pixel_formats and is_convertible(f))
 
     # if OpenCV compatible color format is supported directly, use that
     if opencv_display_format in cam_formats:
@@ -147,55 +164,113 @@ def setup_pixel_format(cam: Camera):
 
 
 class Handler:
+    # One image may be displayed, one may wait in the display queue and one may be written by the
+    # frame callback. With three buffers an image is never overwritten while it is still in use
+    BUFFER_COUNT = 3
+
     def __init__(self):
-        self.display_queue = Queue(10)
+        # Only the most recent image is kept for display. If displaying is slower than the camera,
+        # older images are dropped instead of blocking the frame callback and delaying the stream
+        self.display_queue = Queue(1)
+        # Images are written into preallocated buffers, so no memory is allocated per frame. The
+        # buffers are allocated once the first frame is received and returned after display
+        self.free_buffers: Optional[Queue] = None
 
     def get_image(self):
         return self.display_queue.get(True)
 
+    def release_image(self, image):
+        self.free_buffers.put_nowait(image)
+
+    def put_image(self, image):
+        try:
+            self.release_image(self.display_queue.get_nowait())
+        except Empty:
+            pass
+
+        self.display_queue.put_nowait(image)
+
+    def allocate_buffers(self, template):
+        self.free_buffers = Queue(Handler.BUFFER_COUNT)
+        for _ in range(Handler.BUFFER_COUNT):
+            self.free_buffers.put_nowait(numpy.empty(template.shape, dtype=template.dtype.type))
+
     def __call__(self, cam: Camera, stream: Stream, frame: Frame):
         if frame.get_status() == FrameStatus.Complete:
             print('{} acquired {}'.format(cam, frame), flush=True)
 
             # Convert frame if it is not already the correct format
             if frame.get_pixel_format() == opencv_display_format:
-                display = frame
+                # The image is a view on the frame buffer, which is requeued below. Copy it into a
+                # reusable buffer so the display loop does not read memory the camera writes to
+                view = frame.as_opencv_image()
+                if self.free_buffers is None:
+                    self.allocate_buffers(view)
+
+                image = self.free_buffers.get_nowait()
+                numpy.copyto(image, view)
             else:
-                # This creates a copy of the frame. The original `frame` object can be requeued
-                # safely while `display` is used
-                display = frame.convert_pixel_format(opencv_display_format)
+                if self.free_buffers is None:
+                    # Let VmbPy allocate the first conversion result to get the layout of the
+                    # converted image
+                    self.allocate_buffers(
+                        frame.convert_pixel_format(opencv_display_format).as_opencv_image())
 
-            self.display_queue.put(display.as_opencv_image(), True)
+                # Write the conversion result directly into a reusable buffer. The original
+                # `frame` object can be requeued safely while `image` is used
+                image = self.free_buffers.get_nowait()
+                frame.convert_pixel_format(opencv_display_format, destination_buffer=image.data)
+
+            self.put_image(image)
 
         cam.queue_frame(frame)
 
 
+def create_window(name: str):
+    import cv2
+    # Prefer an OpenGL window, so the image is drawn by the GPU instead of being copied to the
+    # display by the CPU. This requires OpenCV to be built with OpenGL support. If it is not
+    # available, a regular window is used
+    try:
+        cv2.namedWindow(name, cv2.WINDOW_OPENGL | cv2.WINDOW_AUTOSIZE)
+
+    except cv2.error:
+        cv2.namedWindow(name, cv2.WINDOW_AUTOSIZE)
+
+
 def main():
     print_preamble()
     cam_id = parse_args()
 
-    with VmbSystem.get_instance():
-        with get_camera(cam_id) as cam:
+    with VmbSystem.get_instance() as vmb:
+        with get_camera(vmb, cam_id) as cam:
             # setup general camera settings and the pixel format in which frames are recorded
             setup_camera(cam)
             setup_pixel_format(cam)
             handler = Handler()
 
             try:
-                # Start Streaming with a custom a buffer of 10 Frames (defaults to 5)
-                cam.start_streaming(handler=handler, buffer_count=10)
+                # Start Streaming with a custom a buffer of 10 Frames (defaults to 5). With
+                # `AllocationMode.AnnounceFrame` the frame buffers are allocated once by VmbPy when
+                # streaming starts and are reused for every frame until streaming is stopped
+                cam.start_streaming(handler=handler,
+                                    buffer_count=10,
+                                    allocation_mode=AllocationMode.AnnounceFrame)
 
                 msg = 'Stream from \'{}\'. Press <Enter> to stop stream.'
                 import cv2
+                window_name = msg.format(cam.get_name())
+                create_window(window_name)
                 ENTER_KEY_CODE = 13
                 while True:
                     key = cv2.waitKey(1)
                     if key == ENTER_KEY_CODE:
-                        cv2.destroyWindow(msg.format(cam.get_name()))
+                        cv2.destroyWindow(window_name)
                         break
 
                     display = handler.get_image()
-                    cv2.imshow(msg.format(cam.get_name()), display)
+                    cv2.imshow(window_name, display)
+                    handler.release_image(display)
 
             finally:
                 cam.stop_streaming()
@@ -26,6 +26,8 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
 import sys
+import threading
+import time
 from typing import Optional
 
 from vmbpy import *
@@ -71,21 +73,28 @@ def parse_args() -> Optional[str]:
     return None if argc == 0 else args[0]
 
 
-def get_camera(camera_id: Optional[str]) -> Camera:
-    with VmbSystem.get_instance() as vmb:
-        if camera_id:
-            try:
-                return vmb.get_camera_by_id(camera_id)
+def get_camera(vmb: VmbSystem, camera_id: Optional[str]) -> Camera:
+    if camera_id:
+        try:
+            return vmb.get_camera_by_id(camera_id)
+
+        except VmbCameraError:
+            abort('Failed to access Camera \'{}\'. Abort.'.format(camera_id))
+
+    else:
+        cams = vmb.get_all_cameras()
+        if not cams:
+            abort('No Cameras accessible. Abort.')
 
-            except VmbCameraError:
-                abort('Failed to access Camera \'{}\'. Abort.'.format(camera_id))
+        return cams[0]
 
-        else:
-            cams = vmb.get_all_cameras()
-            if not cams:
-                abort('No Cameras accessible. Abort.')
 
-            return cams[0]
+def wait_feature_done(cmd_feat: CommandFeature, poll_ms: int = 1, timeout_s: float = 5.0):
+    # Sleep between polls instead of spinning, so waiting for the command does not occupy a full
+    # CPU core. Gives up silently after `timeout_s` seconds
+    deadline = time.monotonic() + timeout_s
+    while not cmd_feat.is_done() and time.monotonic() < deadline:
+        time.sleep(poll_ms / 1000)
 
 
 def setup_camera(cam: Camera):
@@ -94,8 +103,7 @@ def setup_camera(cam: Camera):
         try:
             stream = cam.get_streams()[0]
             stream.GVSPAdjustPacketSize.run()
-            while not stream.GVSPAdjustPacketSize.is_done():
-                pass
+            wait_feature_done(stream.GVSPAdjustPacketSize)
 
         except (AttributeError, VmbFeatureError):
             pass
@@ -115,8 +123,8 @@ def main():
     print_preamble()
     cam_id = parse_args()
 
-    with VmbSystem.get_instance():
-        with get_camera(cam_id) as cam:
+    with VmbSystem.get_instance() as vmb:
+        with get_camera(vmb, cam_id) as cam:
             setup_camera(cam)
 
             # Disable all events notifications that might be currently enabled
@@ -131,8 +139,20 @@ def main():
             # Register callback for the EventAcquisitionStart feature
             cam.EventAcquisitionStart.register_change_handler(feature_changed_handler)
 
-            # Acquire a single Frame. This starts acquisition and triggers the selected event
-            cam.get_frame()
+            # Stream until the first Frame is received. This starts acquisition and triggers the
+            # selected event without the setup overhead of a synchronous single frame acquisition
+            frame_received = threading.Event()
+
+            def frame_handler(cam: Camera, stream: Stream, frame: Frame):
+                frame_received.set()
+                cam.queue_frame(frame)
+
+            cam.start_streaming(frame_handler, buffer_count=1)
+            try:
+                frame_received.wait(timeout=2.0)
+
+            finally:
+                cam.stop_streaming()
 
 
 if __name__ == '__main__':
@@ -25,6 +25,9 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import sys
+import threading
+import time
+from collections import deque
 from typing import Optional
 
 from vmbpy import *
@@ -70,37 +73,93 @@ def parse_args() -> Optional[str]:
     return None if argc == 0 else args[0]
 
 
-def get_camera(camera_id: Optional[str]) -> Camera:
-    with VmbSystem.get_instance() as vmb:
-        if camera_id:
-            try:
-                return vmb.get_camera_by_id(camera_id)
+def get_camera(vmb: VmbSystem, camera_id: Optional[str]) -> Camera:
+    if camera_id:
+        try:
+            return vmb.get_camera_by_id(camera_id)
 
-            except VmbCameraError:
-                abort('Failed to access Camera \'{}\'. Abort.'.format(camera_id))
+        except VmbCameraError:
+            abort('Failed to access Camera \'{}\'. Abort.'.format(camera_id))
 
-        else:
-            cams = vmb.get_all_cameras()
-            if not cams:
-                abort('No Cameras accessible. Abort.')
+    else:
+        cams = vmb.get_all_cameras()
+        if not cams:
+            abort('No Cameras accessible. Abort.')
+
+        return cams[0]
+
+
+def wait_feature_done(cmd_feat: CommandFeature, poll_ms: int = 1, timeout_s: float = 5.0):
+    # Sleep between polls instead of spinning, so waiting for the command does not occupy a full
+    # CPU core. Gives up silently after `timeout_s` seconds
+    deadline = time.monotonic() + timeout_s
+    while not cmd_feat.is_done() and time.monotonic() < deadline:
+        time.sleep(poll_ms / 1000)
+
+
+def get_buffer_count(cam: Camera, min_count: int = 10, max_count: int = 40,
+                     slack_s: float = 0.3) -> int:
+    # Frames arriving while all buffers are in use are dropped by the transport layer. Use enough
+    # buffers to hold roughly `slack_s` seconds of frames so short hiccups in the frame callback do
+    # not lose frames. More buffers mean more memory (buffer_count * PayloadSize), so the count is
+    # capped at `max_count`
+    try:
+        fps = cam.AcquisitionFrameRate.get()
 
-            return cams[0]
+    except (AttributeError, VmbFeatureError):
+        return min_count
+
+    return min(max_count, max(min_count, int(fps * slack_s)))
 
 
 class ChunkExample:
     def __init__(self, cam: Camera) -> None:
         self.cam = cam
+        # Used in the frame callback. Looked up once instead of for every frame
+        self.cam_id = cam.get_id()
         self.enabled_chunk_selectors = []
+        self.chunk_feature_names = ()
+        # Messages from the frame callback are collected here and written to stdout in batches by
+        # a separate thread, so the callback does not have to wait for console output. If the
+        # console can not keep up, the oldest messages are discarded
+        self.log = deque(maxlen=1024)
+
+    def log_message(self, msg: str):
+        self.log.append(msg)
+
+    def flush_log(self):
+        lines = []
+        while self.log:
+            lines.append(self.log.popleft())
+
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
+
+    def print_log(self, stop: threading.Event, interval_s: float = 0.1):
+        while not stop.wait(interval_s):
+            self.flush_log()
+
+        self.flush_log()
 
     def run(self):
         with self.cam:
             self.setup_camera()
             print('Press <enter> to stop Frame acquisition.')
+            stop_printing = threading.Event()
+            printer = threading.Thread(target=self.print_log, args=(stop_printing,))
+            printer.start()
             try:
-                self.cam.start_streaming(handler=self.frame_callback, buffer_count=10)
+                # Frame buffers are allocated once by VmbPy and reused for every frame until
+                # streaming is stopped
+                self.cam.start_streaming(handler=self.frame_callback,
+                                         buffer_count=get_buffer_count(self.cam),
+                                         allocation_mode=AllocationMode.AnnounceFrame)
                 input()
             finally:
                 self.cam.stop_streaming()
+                stop_printing.set()
+                printer.join()
 
     def setup_camera(self):
         with self.cam:
@@ -108,8 +167,7 @@ class ChunkExample:
             try:
                 stream = self.cam.get_streams()[0]
                 stream.GVSPAdjustPacketSize.run()
-                while not stream.GVSPAdjustPacketSize.is_done():
-                    pass
+                wait_feature_done(stream.GVSPAdjustPacketSize)
 
             except (AttributeError, VmbFeatureError):
                 pass
@@ -126,39 +184,43 @@ class ChunkExample:
                         print('The device does not support chunk feature "{}". It was not enabled.'
                               ''.format(selector))
                 self.cam.ChunkModeActive.set(True)
+                # The chunk features are looked up by name for every frame, so the names are
+                # only built once
+                self.chunk_feature_names = tuple('Chunk' + selector
+                                                 for selector in self.enabled_chunk_selectors)
             except (AttributeError, VmbFeatureError):
                 abort('Failed to enable Chunk Mode for camera \'{}\'. Abort.'
                       ''.format(self.cam.get_id()))
 
     def frame_callback(self, cam: Camera, stream: Stream, frame: Frame):
-        print('{} acquired {}'.format(cam, frame), flush=True)
+        self.log_message('Camera(id={}) acquired Frame(id={})'.format(self.cam_id, frame.get_id()))
         if frame.contains_chunk_data():
             frame.access_chunk_data(self.chunk_callback)
         else:
-            print('No Chunk Data present', flush=True)
+            self.log_message('No Chunk Data present')
         cam.queue_frame(frame)
 
     def chunk_callback(self, features: FeatureContainer):
         # Print information provided by chunk features that were enabled for this example. More
         # features are available (e.g. via features.get_all_features())
-        if self.enabled_chunk_selectors:
+        if self.chunk_feature_names:
             msg = 'Chunk Data:'
-            for selector in self.enabled_chunk_selectors:
-                chunk_feature_name = 'Chunk' + selector
-                # Access to chunk data is only possible via the passed FeatureContainer instance
+            for chunk_feature_name in self.chunk_feature_names:
+                # Access to chunk data is only possible via the passed FeatureContainer instance.
+                # It is created anew for every frame, so feature objects can not be kept
                 chunk_feature = features.get_feature_by_name(chunk_feature_name)
                 msg += ' {}={}'.format(chunk_feature_name, chunk_feature.get())
         else:
             msg = 'No chunk selectors were enabled. No chunk data to show.'
-        print(msg, flush=True)
+        self.log_message(msg)
 
 
 def main():
     print_preamble()
     cam_id = parse_args()
 
-    with VmbSystem.get_instance():
-        cam = get_camera(cam_id)
+    with VmbSystem.get_instance() as vmb:
+        cam = get_camera(vmb, cam_id)
         chunk_example = ChunkExample(cam)
         chunk_example.run()
 
@@ -25,6 +25,7 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import os
+import shutil
 import sys
 import tempfile
 
@@ -34,6 +35,20 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from helpers import VmbPyTestCase
 
+# Directory of this file. Used as absolute location for settings files in the path tests
+TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def get_valid_paths(tmpdir: str, suffix: str):
+    # Valid settings file locations: relative, relative to the current directory, in a given
+    # directory and absolute
+    return (
+        'valid1_{}.xml'.format(suffix),
+        os.path.join('.', 'valid2_{}.xml'.format(suffix)),
+        os.path.join(tmpdir, 'valid3_{}.xml'.format(suffix)),
+        os.path.join(TEST_DIR, 'valid4_{}.xml'.format(suffix)),
+    )
+
 
 class PersistableFeatureContainerTest(VmbPyTestCase):
     @classmethod
@@ -103,12 +118,7 @@ class PersistableFeatureContainerTest(VmbPyTestCase):
 
         # create a temporary directory to test relative paths with subdirs
         with tempfile.TemporaryDirectory() as tmpdir:
-            valid_paths = (
-                'valid1_save.xml',
-                os.path.join('.', 'valid2_save.xml'),
-                os.path.join(tmpdir, 'valid3_save.xml'),
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), 'valid4_save.xml'),
-            )
+            valid_paths = get_valid_paths(tmpdir, 'save')
             tl = self.vmb.get_all_transport_layers()[0]
             self.assertRaises(ValueError, tl.save_settings, 'inval.xm')
 
@@ -121,21 +131,19 @@ class PersistableFeatureContainerTest(VmbPyTestCase):
 
         # create a temporary directory to test relative paths with subdirs
         with tempfile.TemporaryDirectory() as tmpdir:
-            valid_paths = (
-                'valid1_load.xml',
-                os.path.join('.', 'valid2_load.xml'),
-                os.path.join(tmpdir, 'valid3_load.xml'),
-                os.path.join(os.path.dirname(os.path.abspath(__file__)), 'valid4_load.xml'),
-            )
+            valid_paths = get_valid_paths(tmpdir, 'load')
             tl = self.vmb.get_all_transport_layers()[0]
             self.assertRaises(ValueError, tl.load_settings, 'inval.xm', PersistType.All)
 
             for path in valid_paths:
                 self.assertRaises(ValueError, tl.load_settings, path, PersistType.All)
 
-            for path in valid_paths:
-                tl.save_settings(path, PersistType.All)
+            # Settings are only saved once. All other locations receive a copy of that file
+            tl.save_settings(valid_paths[0], PersistType.All)
+            for path in valid_paths[1:]:
+                shutil.copyfile(valid_paths[0], path)
 
+            for path in valid_paths:
                 self.assertNoRaise(tl.load_settings, path, PersistType.All)
                 os.remove(path)
 
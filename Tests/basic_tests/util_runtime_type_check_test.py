@@ -25,6 +25,7 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import os
+import subprocess
 import sys
 from typing import Callable, Dict, Optional, Tuple, Type, Union
 
@@ -259,3 +260,61 @@ class RuntimeTypeCheckTest(VmbPyTestCase):
         self.assertNoRaise(func, lambda a1, a2: 0.0, 'str', 0.0)
         self.assertRaises(TypeError, func, lambda a1: 'foo', 'str', 0.0)
         self.assertRaises(TypeError, func, lambda a1, a2, a3: 23, 'str', 0.0)
+
+    def test_disable(self):
+        # Expectation: Disabled checks pass arguments unchecked to the wrapped function. Checks
+        # are performed again after enabling them.
+
+        @RuntimeTypeCheckEnable()
+        def test_func(a: int) -> int:
+            return a
+
+        try:
+            RuntimeTypeCheckEnable.disable()
+            self.assertFalse(RuntimeTypeCheckEnable.is_enabled())
+            self.assertEqual(test_func('str'), 'str')
+
+        finally:
+            RuntimeTypeCheckEnable.enable()
+
+        self.assertTrue(RuntimeTypeCheckEnable.is_enabled())
+        self.assertRaises(TypeError, test_func, 'str')
+
+    def test_enable_runtime_type_checks(self):
+        # Expectation: The public switch toggles the checks of all decorated callables.
+
+        @RuntimeTypeCheckEnable()
+        def test_func(a: int) -> int:
+            return a
+
+        try:
+            enable_runtime_type_checks(False)
+            self.assertFalse(runtime_type_checks_enabled())
+            self.assertEqual(test_func('str'), 'str')
+
+        finally:
+            enable_runtime_type_checks()
+
+        self.assertTrue(runtime_type_checks_enabled())
+        self.assertRaises(TypeError, test_func, 'str')
+
+    def test_pass_through_env(self):
+        # Expectation: With VMBPY_FAST=1 set on import, TraceEnable and RuntimeTypeCheckEnable
+        # return the decorated function unchanged and type checks are reported as disabled.
+        code = ('from vmbpy.util import (RuntimeTypeCheckEnable, TraceEnable,\n'
+                '                        runtime_type_checks_enabled)\n'
+                'def f(a: int) -> int:\n'
+                '    return a\n'
+                'assert TraceEnable()(f) is f\n'
+                'assert RuntimeTypeCheckEnable()(f) is f\n'
+                'RuntimeTypeCheckEnable.enable()\n'
+                'assert not RuntimeTypeCheckEnable.is_enabled()\n'
+                'assert not runtime_type_checks_enabled()\n')
+
+        env = dict(os.environ, VMBPY_FAST='1')
+        root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [root, env.get('PYTHONPATH')]))
+
+        result = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True,
+                                text=True)
+        self.assertEqual(result.returncode, 0, result.stderr)
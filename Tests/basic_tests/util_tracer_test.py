@@ -35,6 +35,43 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from helpers import VmbPyTestCase
 
 
+# Traced callables are defined once for all tests. They do not keep any state between calls.
+@TraceEnable()
+def _traced_identity(arg):
+    return str(arg)
+
+
+@TraceEnable()
+def _traced_raiser(arg):
+    raise TypeError('my error')
+
+
+@TraceEnable()
+def _traced_noarg():
+    pass
+
+
+_traced_lambda = TraceEnable()(lambda: 0)
+
+
+class _TracedObj:
+    @TraceEnable()
+    def __init__(self, arg):
+        self.arg = arg
+
+    @TraceEnable()
+    def __str__(self):
+        return '_TracedObj({})'.format(str(self.arg))
+
+    @TraceEnable()
+    def __repr__(self):
+        return '_TracedObj({})'.format(repr(self.arg))
+
+    @TraceEnable()
+    def __call__(self):
+        pass
+
+
 class TracerTest(VmbPyTestCase):
     def setUp(self):
         self.log = Log.get_instance()
@@ -47,91 +84,57 @@ class TracerTest(VmbPyTestCase):
     def test_trace_normal_exit(self):
         # Expectation: Must not throw on call normal func.
         # Each traced call must add two Log entries:
-
-        @TraceEnable()
-        def test_func(arg):
-            return str(arg)
-
         with self.assertLogs(self.log, level=LogLevel.Trace) as logs:
-            self.assertEqual(test_func(1), '1')
+            self.assertEqual(_traced_identity(1), '1')
             self.assertEqual(len(logs.records), 2)
 
-            self.assertEqual(test_func('test'), 'test')
+            self.assertEqual(_traced_identity('test'), 'test')
             self.assertEqual(len(logs.records), 4)
 
-            self.assertEqual(test_func(2.0), '2.0')
+            self.assertEqual(_traced_identity(2.0), '2.0')
             self.assertEqual(len(logs.records), 6)
 
     def test_trace_raised_exit(self):
         # Expectation: Throws internally thrown exception and adds two log entries
         # Each traced call must add two Log entries:
-
-        @TraceEnable()
-        def test_func(arg):
-            raise TypeError('my error')
-
         with self.assertLogs(self.log, level=LogLevel.Trace) as logs:
-            self.assertRaises(TypeError, test_func, 1)
+            self.assertRaises(TypeError, _traced_raiser, 1)
             self.assertEqual(len(logs.records), 2)
 
-            self.assertRaises(TypeError, test_func, 'test')
+            self.assertRaises(TypeError, _traced_raiser, 'test')
             self.assertEqual(len(logs.records), 4)
 
-            self.assertRaises(TypeError, test_func, 2.0)
+            self.assertRaises(TypeError, _traced_raiser, 2.0)
             self.assertEqual(len(logs.records), 6)
 
     def test_trace_function(self):
         # Expectation: Normal functions must be traceable
-        @TraceEnable()
-        def test_func():
-            pass
-
         with self.assertLogs(self.log, level=LogLevel.Trace) as logs:
-            test_func()
+            _traced_noarg()
             self.assertEqual(len(logs.records), 2)
 
-            test_func()
+            _traced_noarg()
             self.assertEqual(len(logs.records), 4)
 
-            test_func()
+            _traced_noarg()
             self.assertEqual(len(logs.records), 6)
 
     def test_trace_lambda(self):
         # Expectation: Lambdas must be traceable
-
-        test_lambda = TraceEnable()(lambda: 0)
-
         with self.assertLogs(self.log, level=LogLevel.Trace) as logs:
-            test_lambda()
+            _traced_lambda()
             self.assertEqual(len(logs.records), 2)
 
-            test_lambda()
+            _traced_lambda()
             self.assertEqual(len(logs.records), 4)
 
-            test_lambda()
+            _traced_lambda()
             self.assertEqual(len(logs.records), 6)
 
     def test_trace_object(self):
         # Expectation: Objects must be traceable including constructors.
-        class TestObj:
-            @TraceEnable()
-            def __init__(self, arg):
-                self.arg = arg
-
-            @TraceEnable()
-            def __str__(self):
-                return 'TestObj({})'.format(str(self.arg))
-
-            @TraceEnable()
-            def __repr__(self):
-                return 'TestObj({})'.format(repr(self.arg))
-
-            @TraceEnable()
-            def __call__(self):
-                pass
-
         with self.assertLogs(self.log, level=LogLevel.Trace) as logs:
-            test_obj = TestObj('test')
+            test_obj = _TracedObj('test')
             self.assertEqual(len(logs.records), 2)
 
             str(test_obj)
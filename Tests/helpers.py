@@ -82,3 +82,20 @@ def calculate_acquisition_time(cam: vmbpy.Camera, num_frames: int) -> float:
     """
     fps = cam.get_feature_by_name('AcquisitionFrameRate').get()
     return num_frames / fps
+
+
+def calculate_frame_timeout(cam: vmbpy.Camera, num_frames: int, fallback: float = 5.0) -> float:
+    """
+    Calculate a timeout in seconds for receiving `num_frames` from `cam` in current configuration.
+
+    One second is added to the acquisition time for acquisition overhead and an additional 10% as
+    buffer. If the acquisition time can not be calculated, `fallback` is returned instead.
+
+    WARNING: The cams context must already be entered as this function tries to access camera
+    features!
+    """
+    try:
+        return 1.1 * (1.0 + calculate_acquisition_time(cam, num_frames))
+
+    except vmbpy.VmbFeatureError:
+        return fallback
@@ -36,7 +36,7 @@ from vmbpy.frame import *
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from helpers import VmbPyTestCase, calculate_acquisition_time
+from helpers import VmbPyTestCase, calculate_frame_timeout
 
 
 def dummy_frame_handler(cam: Camera, stream: Stream, frame: Frame):
@@ -69,22 +69,36 @@ def _open_camera(id: str,
 
 
 class CamCameraTest(VmbPyTestCase):
-    def setUp(self):
-        self.vmb = VmbSystem.get_instance()
-        self.vmb._startup()
+    # Starting VmbSystem discovers all transport layers, interfaces and cameras. This is only done
+    # once for all tests of this class. Tests that shut VmbSystem down must restart it themselves
+    # via `_restart_vmb`.
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vmb = VmbSystem.get_instance()
+        cls.vmb._startup()
 
         try:
-            self.cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
+            cls.cam = cls.vmb.get_camera_by_id(cls.get_test_camera_id())
 
         except VmbCameraError as e:
-            self.vmb._shutdown()
+            cls.vmb._shutdown()
             raise Exception('Failed to lookup Camera.') from e
 
+    @classmethod
+    def tearDownClass(cls):
+        cls.vmb._shutdown()
+
+    @classmethod
+    def _restart_vmb(cls):
+        cls.vmb._startup()
+        cls.cam = cls.vmb.get_camera_by_id(cls.get_test_camera_id())
+
+    def setUp(self):
         self.cam.set_access_mode(AccessMode.Full)
 
     def tearDown(self):
         self.cam.set_access_mode(AccessMode.Full)
-        self.vmb._shutdown()
 
     def test_camera_context_manager_access_mode(self):
         # Expectation: Entering Context must not throw in cases where the current access mode is
@@ -272,10 +286,14 @@ class CamCameraTest(VmbPyTestCase):
         # Shutdown API
         self.vmb._shutdown()
 
-        # Access invalid Iterator
-        with self.assertRaises(RuntimeError):
-            for _ in gener:
-                pass
+        try:
+            # Access invalid Iterator
+            with self.assertRaises(RuntimeError):
+                for _ in gener:
+                    pass
+
+        finally:
+            self._restart_vmb()
 
     def test_camera_capture_error_outside_camera_scope(self):
         # Expectation: Camera access outside of Camera scope must lead to a RuntimeError
@@ -344,12 +362,7 @@ class CamCameraTest(VmbPyTestCase):
 
         with self.cam:
             try:
-                try:
-                    timeout = calculate_acquisition_time(self.cam, frame_count)
-                    # Add one second extra time for acquisition overhead and additional 10% buffer
-                    timeout = 1.1 * (1.0 + timeout)
-                except VmbFeatureError:
-                    timeout = 5.0
+                timeout = calculate_frame_timeout(self.cam, frame_count)
                 self.cam.start_streaming(handler, frame_count)
 
                 # Wait until the FrameHandler has been executed for each queued frame
@@ -382,12 +395,7 @@ class CamCameraTest(VmbPyTestCase):
 
         with self.cam:
             try:
-                try:
-                    timeout = calculate_acquisition_time(self.cam, frame_count * frame_reuse)
-                    # Add one second extra time for acquisition overhead and additional 10% buffer
-                    timeout = 1.1 * (1.0 + timeout)
-                except VmbFeatureError:
-                    timeout = 5.0
+                timeout = calculate_frame_timeout(self.cam, frame_count * frame_reuse)
                 self.cam.start_streaming(handler, frame_count)
 
                 # Wait until the FrameHandler has been executed for each queued frame
@@ -425,12 +433,7 @@ class CamCameraTest(VmbPyTestCase):
         handler = FrameHandler(frame_count, self)
         with self.cam:
             try:
-                try:
-                    timeout = calculate_acquisition_time(self.cam, frame_count)
-                    # Add one second extra time for acquisition overhead and additional 10% buffer
-                    timeout = 1.1 * (1.0 + timeout)
-                except VmbFeatureError:
-                    timeout = 5.0
+                timeout = calculate_frame_timeout(self.cam, frame_count)
                 self.cam.start_streaming(handler, frame_count)
 
                 # Wait until the FrameHandler has been executed for each queued frame
@@ -454,18 +457,25 @@ class CamCameraTest(VmbPyTestCase):
 
         self.assertRaises(TypeError, self.cam.set_access_mode, -1)
 
+        invalid_calls = (
+            (self.cam.get_frame, ('hi',)),
+            (self.cam.get_features_selected_by, ('No Feature',)),
+            (self.cam.get_features_by_type, (0.0,)),
+            (self.cam.get_feature_by_name, (0,)),
+            (self.cam.start_streaming, (valid_handler, 'no int')),
+            (self.cam.start_streaming, (invalid_handler_1,)),
+            (self.cam.start_streaming, (invalid_handler_2,)),
+            (self.cam.start_streaming, (invalid_handler_3,)),
+            (self.cam.save_settings, (0, PersistType.All)),
+            (self.cam.save_settings, ('foo.xml', 'false type')),
+        )
+
         with self.cam:
             # Expectation: raise TypeError on passing invalid parameters
-            self.assertRaises(TypeError, self.cam.get_frame, 'hi')
-            self.assertRaises(TypeError, self.cam.get_features_selected_by, 'No Feature')
-            self.assertRaises(TypeError, self.cam.get_features_by_type, 0.0)
-            self.assertRaises(TypeError, self.cam.get_feature_by_name, 0)
-            self.assertRaises(TypeError, self.cam.start_streaming, valid_handler, 'no int')
-            self.assertRaises(TypeError, self.cam.start_streaming, invalid_handler_1)
-            self.assertRaises(TypeError, self.cam.start_streaming, invalid_handler_2)
-            self.assertRaises(TypeError, self.cam.start_streaming, invalid_handler_3)
-            self.assertRaises(TypeError, self.cam.save_settings, 0, PersistType.All)
-            self.assertRaises(TypeError, self.cam.save_settings, 'foo.xml', 'false type')
+            for func, args in invalid_calls:
+                with self.subTest(f'{func.__name__}{args}'):
+                    self.assertRaises(TypeError, func, *args)
+
             for args in (('3',), (1, 'foo')):
                 with self.assertRaises(TypeError):
                     for _ in self.cam.get_frame_generator(*args):
@@ -489,12 +499,7 @@ class CamCameraTest(VmbPyTestCase):
         handler = FrameHandler(self)
         with self.cam:
             try:
-                try:
-                    timeout = calculate_acquisition_time(self.cam, frame_count)
-                    # Add one second extra time for acquisition overhead and additional 10% buffer
-                    timeout = 1.1 * (1.0 + timeout)
-                except VmbFeatureError:
-                    timeout = 5.0
+                timeout = calculate_frame_timeout(self.cam, frame_count)
                 self.cam.start_streaming(handler, frame_count)
 
                 # Wait until the FrameHandler has been executed for each queued frame
@@ -27,59 +27,72 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 import os
 import sys
 import threading
+import unittest
 
 from vmbpy import *
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from helpers import VmbPyTestCase, calculate_acquisition_time
+from helpers import VmbPyTestCase, calculate_frame_timeout
 
 
 class ChunkAccessTest(VmbPyTestCase):
-    def setUp(self):
-        self.vmb = VmbSystem.get_instance()
-        self.vmb._startup()
+    # Starting VmbSystem and opening the camera is only done once for all tests of this class.
+    # Chunk features are enabled again before each test since some tests disable them.
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vmb = VmbSystem.get_instance()
+        cls.vmb._startup()
 
         try:
-            self.cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
+            cls.cam = cls.vmb.get_camera_by_id(cls.get_test_camera_id())
 
         except VmbCameraError as e:
-            self.vmb._shutdown()
+            cls.vmb._shutdown()
             raise Exception('Failed to lookup Camera.') from e
 
         try:
-            self.cam._open()
-            self.local_device = self.cam.get_local_device()
+            cls.cam._open()
+            cls.local_device = cls.cam.get_local_device()
         except VmbCameraError as e:
-            self.cam._close()
-            raise Exception('Failed to open Camera {}.'.format(self.cam)) from e
+            cls.cam._close()
+            cls.vmb._shutdown()
+            raise Exception('Failed to open Camera {}.'.format(cls.cam)) from e
 
         try:
-            self.enable_chunk_features()
+            cls.enable_chunk_features()
 
         except (VmbFeatureError, AttributeError):
-            self.cam._close()
-            self.vmb._shutdown()
-            self.skipTest('Required Feature \'ChunkModeActive\' not available.')
+            # tearDownClass is not executed if setUpClass fails (e.g. by skipping the test class)
+            cls.cam._close()
+            cls.vmb._shutdown()
+            raise unittest.SkipTest('Required Feature \'ChunkModeActive\' not available.')
 
-    def tearDown(self):
-        self.disable_chunk_features()
-        self.cam._close()
-        self.vmb._shutdown()
+    @classmethod
+    def tearDownClass(cls):
+        cls.disable_chunk_features()
+        cls.cam._close()
+        cls.vmb._shutdown()
+
+    def setUp(self):
+        self.enable_chunk_features()
 
-    def enable_chunk_features(self):
+    @classmethod
+    def enable_chunk_features(cls):
         # Turn on all Chunk features
-        self.cam.ChunkModeActive.set(False)
-        for value in self.cam.ChunkSelector.get_available_entries():
-            self.cam.ChunkSelector.set(value)
-            self.cam.ChunkEnable.set(True)
-        self.cam.ChunkModeActive.set(True)
-
-    def disable_chunk_features(self):
-        self.cam.ChunkModeActive.set(False)
-        for value in self.cam.ChunkSelector.get_available_entries():
-            self.cam.ChunkSelector.set(value)
-            self.cam.ChunkEnable.set(False)
+        cls.cam.ChunkModeActive.set(False)
+        for value in cls.cam.ChunkSelector.get_available_entries():
+            cls.cam.ChunkSelector.set(value)
+            cls.cam.ChunkEnable.set(True)
+        cls.cam.ChunkModeActive.set(True)
+
+    @classmethod
+    def disable_chunk_features(cls):
+        cls.cam.ChunkModeActive.set(False)
+        for value in cls.cam.ChunkSelector.get_available_entries():
+            cls.cam.ChunkSelector.set(value)
+            cls.cam.ChunkEnable.set(False)
 
     def test_chunk_callback_is_executed(self):
         # Expectation: The chunk callback is executed for every call to `Frame.access_chunk_data`
@@ -95,7 +108,7 @@ class ChunkAccessTest(VmbPyTestCase):
                 frame.access_chunk_data(self.chunk_callback)
                 stream.queue_frame(frame)
 
-                if self.frame_callbacks_executed >= self.frame_limit:
+                if self.frame_callbacks_executed == self.frame_limit:
                     self.is_done.set()
 
             def chunk_callback(self, feats: FeatureContainer):
@@ -104,12 +117,7 @@ class ChunkAccessTest(VmbPyTestCase):
         frame_count = 5
         handler = FrameHandler(frame_count)
         try:
-            try:
-                timeout = calculate_acquisition_time(self.cam, frame_count)
-                # Add one second extra time for acquisition overhead and additional 10% buffer
-                timeout = 1.1 * (1.0 + timeout)
-            except VmbFeatureError:
-                timeout = 5.0
+            timeout = calculate_frame_timeout(self.cam, frame_count)
             self.cam.start_streaming(handler)
             self.assertTrue(handler.is_done.wait(timeout=timeout),
                             'Frame handler did not finish before timeout')
@@ -184,14 +192,9 @@ class ChunkAccessTest(VmbPyTestCase):
         self.disable_chunk_features()
         handler = FrameHandler(self)
         try:
-            try:
-                frame_count = 1
-                timeout = calculate_acquisition_time(self.cam, frame_count)
-                # Add one second extra time for acquisition overhead and additional 10% buffer
-                timeout = 1.1 * (1.0 + timeout)
-            except VmbFeatureError:
-                timeout = 5.0
-            self.cam.start_streaming(handler)
+            frame_count = 1
+            timeout = calculate_frame_timeout(self.cam, frame_count)
+            self.cam.start_streaming(handler, buffer_count=frame_count)
             self.assertTrue(handler.is_done.wait(timeout=timeout),
                             'Frame handler did not finish before timeout')
         finally:
@@ -226,14 +229,9 @@ class ChunkAccessTest(VmbPyTestCase):
 
         handler = FrameHandler()
         try:
-            try:
-                frame_count = 1
-                timeout = calculate_acquisition_time(self.cam, frame_count)
-                # Add one second extra time for acquisition overhead and additional 10% buffer
-                timeout = 1.1 * (1.0 + timeout)
-            except VmbFeatureError:
-                timeout = 5.0
-            self.cam.start_streaming(handler)
+            frame_count = 1
+            timeout = calculate_frame_timeout(self.cam, frame_count)
+            self.cam.start_streaming(handler, buffer_count=frame_count)
             self.assertTrue(handler.is_done.wait(timeout=timeout),
                             'Frame handler did not finish before timeout')
         finally:
@@ -264,7 +262,7 @@ class ChunkAccessTest(VmbPyTestCase):
                     self.exception_was_raised_once = True
                 finally:
                     self.__frame_count += 1
-                    if self.__frame_count >= self.frame_limit:
+                    if self.__frame_count == self.frame_limit:
                         self.is_done.set()
 
             def chunk_callback(self, feats: FeatureContainer):
@@ -276,12 +274,7 @@ class ChunkAccessTest(VmbPyTestCase):
         frame_count = 5
         handler = FrameHandler(frame_count)
         try:
-            try:
-                timeout = calculate_acquisition_time(self.cam, frame_count)
-                # Add one second extra time for acquisition overhead and additional 10% buffer
-                timeout = 1.1 * (1.0 + timeout)
-            except VmbFeatureError:
-                timeout = 5.0
+            timeout = calculate_frame_timeout(self.cam, frame_count)
             self.cam.start_streaming(handler)
             self.assertTrue(handler.is_done.wait(timeout=timeout),
                             'Frame handler did not finish before timeout')
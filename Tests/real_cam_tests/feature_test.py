@@ -36,37 +36,76 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from helpers import VmbPyTestCase
 
+# Maximum time in seconds to wait for a change handler to be executed
+CHANGE_HANDLER_TIMEOUT = 5.0
 
-class CamBaseFeatureTest(VmbPyTestCase):
-    def setUp(self):
-        self.vmb = VmbSystem.get_instance()
-        self.vmb._startup()
+
+class _SetInCallbackHandler:
+    # Change handler writing the current value back to the feature that triggered it
+    def __init__(self):
+        self.raised = False
+        self.event = threading.Event()
+
+    def __call__(self, feat):
+        try:
+            feat.set(feat.get())
+
+        except VmbFeatureError:
+            self.raised = True
+
+        self.event.set()
+
+
+class _CamFeatureTestCase(VmbPyTestCase):
+    # Starting VmbSystem and opening the camera is only done once for all tests of a class.
+    # Subclasses look up the features they test in `setUpFeatures`
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vmb = VmbSystem.get_instance()
+        cls.vmb._startup()
 
         try:
-            self.cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
+            cls.cam = cls.vmb.get_camera_by_id(cls.get_test_camera_id())
 
         except VmbCameraError as e:
-            self.vmb._shutdown()
+            cls.vmb._shutdown()
             raise Exception('Failed to lookup Camera.') from e
 
         try:
-            self.cam._open()
+            cls.cam._open()
 
         except VmbCameraError as e:
-            self.vmb._shutdown()
+            cls.vmb._shutdown()
             raise Exception('Failed to open Camera.') from e
 
         try:
-            self.height = self.cam.get_feature_by_name('Height')
+            cls.setUpFeatures()
+
+        except BaseException:
+            # tearDownClass is not executed if setUpClass fails (e.g. by skipping the test class)
+            cls.cam._close()
+            cls.vmb._shutdown()
+            raise
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.cam._close()
+        cls.vmb._shutdown()
+
+    @classmethod
+    def setUpFeatures(cls):
+        pass
 
-        except VmbCameraError:
-            self.cam._close()
-            self.vmb._shutdown()
-            self.skipTest('Required Feature \'Height\' not available.')
 
-    def tearDown(self):
-        self.cam._close()
-        self.vmb._shutdown()
+class CamBaseFeatureTest(_CamFeatureTestCase):
+    @classmethod
+    def setUpFeatures(cls):
+        try:
+            cls.height = cls.cam.get_feature_by_name('Height')
+
+        except VmbCameraError:
+            raise unittest.SkipTest('Required Feature \'Height\' not available.')
 
     def test_get_name(self):
         # Expectation: Return decoded FeatureName
@@ -173,15 +212,31 @@ class CamBaseFeatureTest(VmbPyTestCase):
         else:
             self.height.set(tmp + inc)
 
-        handler.event.wait()
+        executed = handler.event.wait(CHANGE_HANDLER_TIMEOUT)
 
         self.height.unregister_change_handler(handler)
         self.height.unregister_change_handler(handler)
 
         self.height.set(tmp)
 
+        self.assertTrue(executed, 'Change handler was not executed')
         self.assertEqual(handler.call_cnt, 1)
 
+    def test_change_handler_unhashable(self):
+        # Expectation: Change handlers do not need to be hashable. Callable objects that define
+        # __eq__ without __hash__ can be registered and unregistered.
+        class Handler:
+            def __eq__(self, other):
+                return self is other
+
+            def __call__(self, feat):
+                pass
+
+        handler = Handler()
+
+        self.assertNoRaise(self.height.register_change_handler, handler)
+        self.assertNoRaise(self.height.unregister_change_handler, handler)
+
     def test_stringify_features(self):
         # Expectation: Each Feature must have a __str__ method. Depending on the Feature
         # current Values are queried, this can fail. In those cases, all exceptions are
@@ -193,36 +248,14 @@ class CamBaseFeatureTest(VmbPyTestCase):
             self.assertNoRaise(str, feat)
 
 
-class CamBoolFeatureTest(VmbPyTestCase):
-    def setUp(self):
-        self.vmb = VmbSystem.get_instance()
-        self.vmb._startup()
-
-        try:
-            self.cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
-
-        except VmbCameraError as e:
-            self.vmb._shutdown()
-            raise Exception('Failed to lookup Camera.') from e
-
-        try:
-            self.cam._open()
-
-        except VmbCameraError as e:
-            self.vmb._shutdown()
-            raise Exception('Failed to open Camera.') from e
-
+class CamBoolFeatureTest(_CamFeatureTestCase):
+    @classmethod
+    def setUpFeatures(cls):
         try:
-            self.feat: BoolFeature = self.cam.get_features_by_type(BoolFeature)[0]
+            cls.feat: BoolFeature = cls.cam.get_features_by_type(BoolFeature)[0]
 
         except (VmbCameraError, IndexError):
-            self.cam._close()
-            self.vmb._shutdown()
-            self.skipTest('Could not find a Bool feature to use for the test')
-
-    def tearDown(self):
-        self.cam._close()
-        self.vmb._shutdown()
+            raise unittest.SkipTest('Could not find a Bool feature to use for the test')
 
     def test_get_type(self):
         # Expectation: BoolFeature must return BoolFeature on get_type
@@ -249,24 +282,28 @@ class CamBoolFeatureTest(VmbPyTestCase):
 
 
 class CamCommandFeatureTest(VmbPyTestCase):
-    def setUp(self):
-        self.vmb = VmbSystem.get_instance()
-        self.vmb._startup()
-
-        self.feat = None
-        for inter in self.vmb.get_all_interfaces():
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.vmb = VmbSystem.get_instance()
+        cls.vmb._startup()
+
+        cls.feat = None
+        for inter in cls.vmb.get_all_interfaces():
             try:
-                self.feat = inter.get_features_by_type(CommandFeature)[0]
+                cls.feat = inter.get_features_by_type(CommandFeature)[0]
             except IndexError:
                 # The interface does not have any CommandFeatures
                 pass
 
-        if self.feat is None:
-            self.vmb._shutdown()
-            self.skipTest('Could not find a CommandFeature to execute the test cases with')
+        if cls.feat is None:
+            cls.vmb._shutdown()
+            raise unittest.SkipTest('Could not find a CommandFeature to execute the test cases '
+                                    'with')
 
-    def tearDown(self):
-        self.vmb._shutdown()
+    @classmethod
+    def tearDownClass(cls):
+        cls.vmb._shutdown()
 
     def test_get_type(self):
         # Expectation: CommandFeature must return CommandFeature on get_type
@@ -275,44 +312,20 @@ class CamCommandFeatureTest(VmbPyTestCase):
 
 @unittest.skipIf(VmbPyTestCase.get_test_camera_id().startswith("Sim"),
                  "Test suite skipped in simulation mode.")
-class CamEnumFeatureTest(VmbPyTestCase):
-    def setUp(self):
-        self.vmb = VmbSystem.get_instance()
-        self.vmb._startup()
-
-        try:
-            self.cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
-
-        except VmbCameraError as e:
-            self.vmb._shutdown()
-            raise Exception('Failed to lookup Camera.') from e
-
-        try:
-            self.cam._open()
-
-        except VmbCameraError as e:
-            self.vmb._shutdown()
-            raise Exception('Failed to open Camera.') from e
-
+class CamEnumFeatureTest(_CamFeatureTestCase):
+    @classmethod
+    def setUpFeatures(cls):
         try:
-            self.feat_r = self.cam.get_feature_by_name('DeviceScanType')
+            cls.feat_r = cls.cam.get_feature_by_name('DeviceScanType')
 
         except VmbFeatureError:
-            self.cam._close()
-            self.vmb._shutdown()
-            self.skipTest('Required Feature \'DeviceScanType\' not available.')
+            raise unittest.SkipTest('Required Feature \'DeviceScanType\' not available.')
 
         try:
-            self.feat_rw = self.cam.get_feature_by_name('AcquisitionMode')
+            cls.feat_rw = cls.cam.get_feature_by_name('AcquisitionMode')
 
         except VmbFeatureError:
-            self.cam._close()
-            self.vmb._shutdown()
-            self.skipTest('Required Feature \'AcquisitionMode\' not available.')
-
-    def tearDown(self):
-        self.cam._close()
-        self.vmb._shutdown()
+            raise unittest.SkipTest('Required Feature \'AcquisitionMode\' not available.')
 
     def test_get_type(self):
         # Expectation: EnumFeature must return EnumFeature on get_type
@@ -398,11 +411,12 @@ class CamEnumFeatureTest(VmbPyTestCase):
 
         # Read/Write Feature
         old_entry = self.feat_rw.get()
+        new_entry = self.feat_rw.get_entry(2)
 
         try:
             # Normal operation
-            self.assertNoRaise(self.feat_rw.set, self.feat_rw.get_entry(2))
-            self.assertEqual(self.feat_rw.get(), self.feat_rw.get_entry(2))
+            self.assertNoRaise(self.feat_rw.set, new_entry)
+            self.assertEqual(self.feat_rw.get(), new_entry)
 
             # Provoke FeatureError by setting the feature from the ReadOnly entry.
             self.assertRaises(VmbFeatureError, self.feat_rw.set, entry)
@@ -421,11 +435,12 @@ class CamEnumFeatureTest(VmbPyTestCase):
 
         # Read/Write Feature
         old_entry = self.feat_rw.get()
+        new_entry = self.feat_rw.get_entry(2)
 
         try:
             # Normal operation
-            self.assertNoRaise(self.feat_rw.set, str(self.feat_rw.get_entry(2)))
-            self.assertEqual(self.feat_rw.get(), self.feat_rw.get_entry(2))
+            self.assertNoRaise(self.feat_rw.set, str(new_entry))
+            self.assertEqual(self.feat_rw.get(), new_entry)
 
             # Provoke FeatureError by an invalid enum value
             self.assertRaises(VmbFeatureError, self.feat_rw.set, 'Hopefully invalid')
@@ -444,11 +459,12 @@ class CamEnumFeatureTest(VmbPyTestCase):
 
         # Read/Write Feature
         old_entry = self.feat_rw.get()
+        new_entry = self.feat_rw.get_entry(2)
 
         try:
             # Normal operation
-            self.assertNoRaise(self.feat_rw.set, int(self.feat_rw.get_entry(2)))
-            self.assertEqual(self.feat_rw.get(), self.feat_rw.get_entry(2))
+            self.assertNoRaise(self.feat_rw.set, int(new_entry))
+            self.assertEqual(self.feat_rw.get(), new_entry)
 
             # Provoke FeatureError by an invalid enum value
             self.assertRaises(VmbFeatureError, self.feat_rw.set, -23)
@@ -460,29 +476,16 @@ class CamEnumFeatureTest(VmbPyTestCase):
         # Expected behavior: A set operation within a change handler must
         # Raise a VmbFeatureError to prevent an endless handler execution.
 
-        class Handler:
-            def __init__(self):
-                self.raised = False
-                self.event = threading.Event()
-
-            def __call__(self, feat):
-                try:
-                    feat.set(feat.get())
-
-                except VmbFeatureError:
-                    self.raised = True
-
-                self.event.set()
-
         old_entry = self.feat_rw.get()
 
         try:
-            handler = Handler()
+            handler = _SetInCallbackHandler()
             self.feat_rw.register_change_handler(handler)
 
             # Trigger change handler and wait for callback execution.
             self.feat_rw.set(self.feat_rw.get())
-            handler.event.wait()
+            self.assertTrue(handler.event.wait(CHANGE_HANDLER_TIMEOUT),
+                            'Change handler was not executed')
 
             self.assertTrue(handler.raised)
 
@@ -491,49 +494,25 @@ class CamEnumFeatureTest(VmbPyTestCase):
             self.feat_rw.set(old_entry)
 
 
-class CamFloatFeatureTest(VmbPyTestCase):
-    def setUp(self):
-        self.vmb = VmbSystem.get_instance()
-        self.vmb._startup()
-
-        try:
-            self.cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
-
-        except VmbCameraError as e:
-            self.vmb._shutdown()
-            raise Exception('Failed to lookup Camera.') from e
-
-        try:
-            self.cam._open()
-
-        except VmbCameraError as e:
-            self.vmb._shutdown()
-            raise Exception('Failed to open Camera.') from e
-
+class CamFloatFeatureTest(_CamFeatureTestCase):
+    @classmethod
+    def setUpFeatures(cls):
         try:
-            self.feat_r = self.vmb.get_feature_by_name('Elapsed')
+            cls.feat_r = cls.vmb.get_feature_by_name('Elapsed')
 
         except VmbFeatureError:
-            self.cam._close()
-            self.vmb._shutdown()
-            self.skipTest('Required Feature \'Elapsed\' not available.')
+            raise unittest.SkipTest('Required Feature \'Elapsed\' not available.')
 
         try:
-            self.feat_rw = self.cam.get_feature_by_name('ExposureTime')
+            cls.feat_rw = cls.cam.get_feature_by_name('ExposureTime')
 
         except VmbFeatureError:
             # Some Cameras name ExposureTime as ExposureTimeAbs
             try:
-                self.feat_rw = self.cam.get_feature_by_name('ExposureTimeAbs')
+                cls.feat_rw = cls.cam.get_feature_by_name('ExposureTimeAbs')
 
             except VmbFeatureError:
-                self.cam._close()
-                self.vmb._shutdown()
-                self.skipTest('Required Feature \'ExposureTime\' not available.')
-
-    def tearDown(self):
-        self.cam._close()
-        self.vmb._shutdown()
+                raise unittest.SkipTest('Required Feature \'ExposureTime\' not available.')
 
     def test_get_type(self):
         # Expectation: FloatFeature returns FloatFeature on get_type.
@@ -591,29 +570,16 @@ class CamFloatFeatureTest(VmbPyTestCase):
     def test_set_in_callback(self):
         # Expectation: Calling set within change_handler must raise an VmbFeatureError
 
-        class Handler:
-            def __init__(self):
-                self.raised = False
-                self.event = threading.Event()
-
-            def __call__(self, feat):
-                try:
-                    feat.set(feat.get())
-
-                except VmbFeatureError:
-                    self.raised = True
-
-                self.event.set()
-
         old_entry = self.feat_rw.get()
 
         try:
-            handler = Handler()
+            handler = _SetInCallbackHandler()
             self.feat_rw.register_change_handler(handler)
 
             # Trigger change handler and wait for callback execution.
             self.feat_rw.set(self.feat_rw.get())
-            handler.event.wait()
+            self.assertTrue(handler.event.wait(CHANGE_HANDLER_TIMEOUT),
+                            'Change handler was not executed')
 
             self.assertTrue(handler.raised)
 
@@ -622,44 +588,20 @@ class CamFloatFeatureTest(VmbPyTestCase):
             self.feat_rw.set(old_entry)
 
 
-class CamIntFeatureTest(VmbPyTestCase):
-    def setUp(self):
-        self.vmb = VmbSystem.get_instance()
-        self.vmb._startup()
-
+class CamIntFeatureTest(_CamFeatureTestCase):
+    @classmethod
+    def setUpFeatures(cls):
         try:
-            self.cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
-
-        except VmbCameraError as e:
-            self.vmb._shutdown()
-            raise Exception('Failed to lookup Camera.') from e
-
-        try:
-            self.cam._open()
-
-        except VmbCameraError as e:
-            self.vmb._shutdown()
-            raise Exception('Failed to open Camera.') from e
-
-        try:
-            self.feat_r = self.cam.get_feature_by_name('HeightMax')
+            cls.feat_r = cls.cam.get_feature_by_name('HeightMax')
 
         except VmbFeatureError:
-            self.cam._close()
-            self.vmb._shutdown()
-            self.skipTest('Required Feature \'HeightMax\' not available.')
+            raise unittest.SkipTest('Required Feature \'HeightMax\' not available.')
 
         try:
-            self.feat_rw = self.cam.get_feature_by_name('Height')
+            cls.feat_rw = cls.cam.get_feature_by_name('Height')
 
         except VmbFeatureError:
-            self.cam._close()
-            self.vmb._shutdown()
-            self.skipTest('Required Feature \'Height\' not available.')
-
-    def tearDown(self):
-        self.cam._close()
-        self.vmb._shutdown()
+            raise unittest.SkipTest('Required Feature \'Height\' not available.')
 
     def test_get_type(self):
         # Expectation: IntFeature must return IntFeature on get_type
@@ -714,24 +656,10 @@ class CamIntFeatureTest(VmbPyTestCase):
     def test_set_in_callback(self):
         # Expectation: Setting a value within a Callback must raise a VmbFeatureError
 
-        class Handler:
-            def __init__(self):
-                self.raised = False
-                self.event = threading.Event()
-
-            def __call__(self, feat):
-                try:
-                    feat.set(feat.get())
-
-                except VmbFeatureError:
-                    self.raised = True
-
-                self.event.set()
-
         old_entry = self.feat_rw.get()
 
         try:
-            handler = Handler()
+            handler = _SetInCallbackHandler()
             self.feat_rw.register_change_handler(handler)
 
             # Trigger change handler and wait for callback execution.
@@ -744,7 +672,8 @@ class CamIntFeatureTest(VmbPyTestCase):
             else:
                 self.feat_rw.set(old_entry + inc)
 
-            handler.event.wait()
+            self.assertTrue(handler.event.wait(CHANGE_HANDLER_TIMEOUT),
+                            'Change handler was not executed')
 
             self.assertTrue(handler.raised)
 
@@ -753,52 +682,28 @@ class CamIntFeatureTest(VmbPyTestCase):
             self.feat_rw.set(old_entry)
 
 
-class CamStringFeatureTest(VmbPyTestCase):
-    def setUp(self):
-        self.vmb = VmbSystem.get_instance()
-        self.vmb._startup()
-
-        try:
-            self.cam = self.vmb.get_camera_by_id(self.get_test_camera_id())
-
-        except VmbCameraError as e:
-            self.vmb._shutdown()
-            raise Exception('Failed to lookup Camera.') from e
-
-        try:
-            self.cam._open()
-
-        except VmbCameraError as e:
-            self.vmb._shutdown()
-            raise Exception('Failed to open Camera.') from e
-
-        self.feat_r = None
-        feats = self.cam.get_features_by_type(StringFeature)
+class CamStringFeatureTest(_CamFeatureTestCase):
+    @classmethod
+    def setUpFeatures(cls):
+        cls.feat_r = None
+        feats = cls.cam.get_features_by_type(StringFeature)
 
         for feat in feats:
             if feat.get_access_mode() == (True, False):
-                self.feat_r = feat
+                cls.feat_r = feat
 
-        if self.feat_r is None:
-            self.cam._close()
-            self.vmb._shutdown()
-            self.skipTest('Test requires read only StringFeature.')
+        if cls.feat_r is None:
+            raise unittest.SkipTest('Test requires read only StringFeature.')
 
-        self.feat_rw = None
-        feats = self.cam.get_features_by_type(StringFeature)
+        cls.feat_rw = None
+        feats = cls.cam.get_features_by_type(StringFeature)
 
         for feat in feats:
             if feat.get_access_mode() == (True, True):
-                self.feat_rw = feat
-
-        if self.feat_rw is None:
-            self.cam._close()
-            self.vmb._shutdown()
-            self.skipTest('Test requires read/write StringFeature.')
+                cls.feat_rw = feat
 
-    def tearDown(self):
-        self.cam._close()
-        self.vmb._shutdown()
+        if cls.feat_rw is None:
+            raise unittest.SkipTest('Test requires read/write StringFeature.')
 
     def test_get_type(self):
         # Expectation: StringFeature must return StringFeature on get_type
@@ -848,27 +753,14 @@ class CamStringFeatureTest(VmbPyTestCase):
     def test_set_in_callback(self):
         # Expectation: Setting a value within a Callback must raise a VmbFeatureError
 
-        class Handler:
-            def __init__(self):
-                self.raised = False
-                self.event = threading.Event()
-
-            def __call__(self, feat):
-                try:
-                    feat.set(feat.get())
-
-                except VmbFeatureError:
-                    self.raised = True
-
-                self.event.set()
-
         try:
-            handler = Handler()
+            handler = _SetInCallbackHandler()
             self.feat_rw.register_change_handler(handler)
 
             self.feat_rw.set(self.feat_rw.get())
 
-            handler.event.wait()
+            self.assertTrue(handler.event.wait(CHANGE_HANDLER_TIMEOUT),
+                            'Change handler was not executed')
 
             self.assertTrue(handler.raised)
 
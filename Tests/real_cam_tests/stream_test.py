@@ -30,16 +30,31 @@ import threading
 import time
 
 from vmbpy import *
+from vmbpy.c_binding import VmbCError, byref, call_vmb_c
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from helpers import VmbPyTestCase, calculate_acquisition_time
+from helpers import VmbPyTestCase, calculate_frame_timeout
 
 
 def dummy_frame_handler(cam: Camera, stream: Stream, frame: Frame):
     pass
 
 
+class _FrameCollector:
+    # Keeps every distinct frame passed to the handler. Frames are not queued again.
+    def __init__(self, frame_count):
+        self.frames = {}
+        self.frame_count = frame_count
+        self.event = threading.Event()
+
+    def __call__(self, cam: Camera, stream: Stream, frame: Frame):
+        self.frames[id(frame)] = frame
+
+        if len(self.frames) == self.frame_count:
+            self.event.set()
+
+
 class StreamTest(VmbPyTestCase):
     def setUp(self):
         self.vmb = VmbSystem.get_instance()
@@ -240,12 +255,7 @@ class StreamTest(VmbPyTestCase):
 
         for stream in self.cam.get_streams():
             with self.subTest(f'Stream={stream}'):
-                try:
-                    timeout = calculate_acquisition_time(self.cam, frame_count)
-                    # Add one second extra time for acquisition overhead and additional 10% buffer
-                    timeout = 1.1 * (1.0 + timeout)
-                except VmbFeatureError:
-                    timeout = 5.0
+                timeout = calculate_frame_timeout(self.cam, frame_count)
                 try:
                     self.cam.start_streaming(handler, frame_count)
 
@@ -279,12 +289,7 @@ class StreamTest(VmbPyTestCase):
 
         for stream in self.cam.get_streams():
             with self.subTest(f'Stream={stream}'):
-                try:
-                    timeout = calculate_acquisition_time(self.cam, frame_count * frame_reuse)
-                    # Add one second extra time for acquisition overhead and additional 10% buffer
-                    timeout = 1.1 * (1.0 + timeout)
-                except VmbFeatureError:
-                    timeout = 5.0
+                timeout = calculate_frame_timeout(self.cam, frame_count * frame_reuse)
                 try:
                     stream.start_streaming(handler, frame_count)
 
@@ -295,6 +300,75 @@ class StreamTest(VmbPyTestCase):
                 finally:
                     stream.stop_streaming()
 
+    def test_stream_streaming_restart_reuses_frames(self):
+        # Expectation: Restarting streaming with `reuse_frames` and the same buffer configuration
+        # reuses the frames of the previous streaming session instead of allocating new ones.
+        for stream in self.cam.get_streams():
+            # All announced frames have to be collected to compare both sessions
+            frame_count = max(5, self._get_buffer_minimum(stream))
+
+            for allocation_mode in AllocationMode:
+                with self.subTest(f'Stream={stream}, AllocationMode={allocation_mode}'):
+                    handlers = (_FrameCollector(frame_count), _FrameCollector(frame_count))
+                    for handler in handlers:
+                        self._stream_until_collected(stream, handler, frame_count,
+                                                     allocation_mode)
+
+                    self.assertEqual(handlers[0].frames.keys(), handlers[1].frames.keys())
+
+    def test_stream_streaming_restart_new_buffer_count(self):
+        # Expectation: Restarting streaming with `reuse_frames` but a different buffer count uses
+        # new frames.
+        for stream in self.cam.get_streams():
+            frame_count = max(5, self._get_buffer_minimum(stream))
+
+            for allocation_mode in AllocationMode:
+                with self.subTest(f'Stream={stream}, AllocationMode={allocation_mode}'):
+                    handlers = (_FrameCollector(frame_count), _FrameCollector(frame_count + 1))
+                    self._stream_until_collected(stream, handlers[0], frame_count,
+                                                 allocation_mode)
+                    self._stream_until_collected(stream, handlers[1], frame_count + 1,
+                                                 allocation_mode)
+
+                    # The collectors keep all frames alive, so object ids can not be reused
+                    self.assertFalse(handlers[0].frames.keys() & handlers[1].frames.keys())
+
+    def test_stream_close_revokes_reused_frames(self):
+        # Expectation: Frames kept announced by `reuse_frames` are revoked when the stream is
+        # closed after streaming was stopped.
+        for stream in self.cam.get_streams():
+            frame_count = max(5, self._get_buffer_minimum(stream))
+
+            for allocation_mode in AllocationMode:
+                with self.subTest(f'Stream={stream}, AllocationMode={allocation_mode}'):
+                    handler = _FrameCollector(frame_count)
+                    stream.open()
+                    self._stream_until_collected(stream, handler, frame_count, allocation_mode)
+                    stream.close()
+
+                    # Revoking a frame that is no longer announced fails
+                    for frame in handler.frames.values():
+                        self.assertRaises(VmbCError, call_vmb_c, 'VmbFrameRevoke', stream._handle,
+                                          byref(frame._frame))
+
+    def _stream_until_collected(self, stream, handler, frame_count, allocation_mode):
+        try:
+            stream.start_streaming(handler, frame_count, allocation_mode, reuse_frames=True)
+
+            # Wait until each buffered frame was received once
+            self.assertTrue(handler.event.wait(calculate_frame_timeout(self.cam, frame_count)),
+                            'Handler event was not set. Frame count was not reached')
+
+        finally:
+            stream.stop_streaming()
+
+    def _get_buffer_minimum(self, stream) -> int:
+        try:
+            return stream.get_feature_by_name('StreamAnnounceBufferMinimum').get()
+
+        except VmbFeatureError:
+            return 1
+
     def test_stream_context_sensitivity(self):
         # Expectation: Call get_all_features outside of Camera context raises a RuntimeError and
         # the error message references the Camera context
@@ -113,7 +113,9 @@ __all__ = [
     'ScopedLogEnable',
     'RuntimeTypeCheckEnable',
     'VmbIntEnum',
-    'VmbFlagEnum'
+    'VmbFlagEnum',
+    'enable_runtime_type_checks',
+    'runtime_type_checks_enabled'
 ]
 
 from .camera import AccessMode, Camera, CameraChangeHandler, CameraEvent
@@ -138,5 +140,6 @@ from .util import (LOG_CONFIG_CRITICAL, LOG_CONFIG_CRITICAL_CONSOLE_ONLY,
                    LOG_CONFIG_INFO_FILE_ONLY, LOG_CONFIG_TRACE, LOG_CONFIG_TRACE_CONSOLE_ONLY,
                    LOG_CONFIG_TRACE_FILE_ONLY, LOG_CONFIG_WARNING, LOG_CONFIG_WARNING_CONSOLE_ONLY,
                    LOG_CONFIG_WARNING_FILE_ONLY, Log, LogConfig, LogLevel, RuntimeTypeCheckEnable,
-                   ScopedLogEnable, TraceEnable, VmbIntEnum, VmbFlagEnum)
+                   ScopedLogEnable, TraceEnable, VmbIntEnum, VmbFlagEnum,
+                   enable_runtime_type_checks, runtime_type_checks_enabled)
 from .vmbsystem import VmbSystem
@@ -111,10 +111,11 @@ __all__ = [
     # Exports from ctypes
     'byref',
     'sizeof',
-    'create_string_buffer'
+    'create_string_buffer',
+    'string_at'
 ]
 
-from ctypes import byref, create_string_buffer, sizeof
+from ctypes import byref, create_string_buffer, sizeof, string_at
 
 from .vmb_c import (EXPECTED_VMB_C_VERSION, G_VMB_C_HANDLE, VMB_C_VERSION, VmbAccessMode,
                     VmbCameraInfo, VmbFeatureData, VmbFeatureEnumEntry, VmbFeatureFlags,
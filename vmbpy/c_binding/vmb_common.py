@@ -511,26 +511,43 @@ def _select_vimbax_home(candidates: List[str]) -> str:
     return most_likely_candidates[0]
 
 
-def _as_vmb_file_path(file_path: Optional[str]) -> Optional[VmbFilePathChar]:
-    """Encode a python string to VmbFilePathChar so it can be passed to VmbC
+# The encoding of file paths depends only on the platform. Select the conversion once on import
+# instead of checking the platform on each call.
+if sys.platform == 'win32':
+    def _as_vmb_file_path(file_path: Optional[str]) -> Optional[VmbFilePathChar]:
+        """Encode a python string to VmbFilePathChar so it can be passed to VmbC
+
+        Parses a python string object into the appropriate VmbFilePathChar type depending on the
+        used operating system. The result of this function may be used to pass the correct encoding
+        of some path variable to VmbC functions that expect a VmbFilePathChar input parameter.
+
+        Arguments:
+            file_path:
+                Python string containing the file path that should be passed to a VmbC function, or
+                ``None``. If ``None`` is passed, ``None`` will also be returned so that ctypes may
+                interpret it as a nullptr
+
+        Return:
+            Given string with correct encoding so that ctypes handles the conversion when passed to
+            a VmbC function
+        """
+        return file_path  # type: ignore
 
-    Parses a python string object into the appropriate VmbFilePathChar type depending on the used
-    operating system. The result of this function may be used to pass the correct encoding of some
-    path variable to VmbC functions that expect a VmbFilePathChar input parameter.
+else:
+    def _as_vmb_file_path(file_path: Optional[str]) -> Optional[VmbFilePathChar]:
+        """Encode a python string to VmbFilePathChar so it can be passed to VmbC
 
-    Arguments:
-        file_path:
-            Python string containing the file path that should be passed to a VmbC function, or
-            ``None``. If ``None`` is passed, ``None`` will also be returned so that ctypes may
-            interpret it as a nullptr
+        On all platforms except Windows, VmbC expects file paths as UTF-8 encoded char strings.
 
-    Return:
-        Given string with correct encoding so that ctypes handles the conversion when passed to a
-        VmbC function
-    """
-    if sys.platform == 'win32':
-        return file_path  # type: ignore
-    else:
+        Arguments:
+            file_path:
+                Python string containing the file path that should be passed to a VmbC function, or
+                ``None``. If ``None`` is passed, ``None`` will also be returned so that ctypes may
+                interpret it as a nullptr
+
+        Return:
+            Given string encoded as UTF-8 bytes so that it can be passed to a VmbC function
+        """
         return file_path.encode('utf-8') if file_path else None  # type: ignore
 
 
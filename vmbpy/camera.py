@@ -357,7 +357,8 @@ class Camera(PersistableFeatureContainer):
     def start_streaming(self,
                         handler: FrameHandler,
                         buffer_count: int = 5,
-                        allocation_mode: AllocationMode = AllocationMode.AnnounceFrame):
+                        allocation_mode: AllocationMode = AllocationMode.AnnounceFrame,
+                        reuse_frames: bool = False):
         """Enter streaming mode.
 
         Enter streaming mode is also known as asynchronous frame acquisition. While active, the
@@ -372,6 +373,14 @@ class Camera(PersistableFeatureContainer):
             allocation_mode:
                 Allocation mode deciding if buffer allocation should be done by vmbpy or the
                 Transport Layer
+            reuse_frames:
+                If ``True``, the frames stay announced after ``stop_streaming``. The next call to
+                ``start_streaming`` with ``reuse_frames=True`` reuses them if ``buffer_count``,
+                ``allocation_mode`` and the payload size did not change. On restart all of these
+                frames are queued again, including frames the handler did not pass to
+                ``queue_frame``. Frames of a previous streaming session must therefore not be used
+                anymore once streaming is restarted. By default, all frames are revoked by
+                ``stop_streaming`` and each streaming session uses new frames.
 
         Raises:
             TypeError:
@@ -387,7 +396,8 @@ class Camera(PersistableFeatureContainer):
         """
         self.__streams[0].start_streaming(handler=handler,
                                           buffer_count=buffer_count,
-                                          allocation_mode=allocation_mode)
+                                          allocation_mode=allocation_mode,
+                                          reuse_frames=reuse_frames)
 
     @RaiseIfOutsideContext()
     @TraceEnable()
@@ -397,6 +407,12 @@ class Camera(PersistableFeatureContainer):
         Leave asynchronous frame acquisition. If streaming mode was not activated before, it just
         returns silently.
 
+        If streaming was started with ``reuse_frames=True``, the frames used for streaming stay
+        announced until the camera is closed or streaming is started without ``reuse_frames``. A
+        restart with ``reuse_frames=True`` and matching buffers queues all of them again, so frames
+        of the stopped session must not be used after streaming is restarted. Otherwise all frames
+        are revoked.
+
         Raises:
             RuntimeError:
                 If called outside ``with`` context.
@@ -454,7 +470,7 @@ class Camera(PersistableFeatureContainer):
                 If called outside ``with`` context.
         """
         result = []
-        feat = self.get_feature_by_name('PixelFormat')
+        feat = self._get_feature_by_name('PixelFormat')
 
         # Build intersection between PixelFormat Enum Values and PixelFormat
         # Note: The Mapping is a bit complicated due to different writing styles within
@@ -481,7 +497,7 @@ class Camera(PersistableFeatureContainer):
             RuntimeError:
                 If called outside ``with`` context.
         """
-        enum_value = str(self.get_feature_by_name('PixelFormat').get()).upper()
+        enum_value = str(self._get_feature_by_name('PixelFormat').get()).upper()
 
         for k in PixelFormat.__members__:
             if k.upper() == enum_value:
@@ -508,7 +524,7 @@ class Camera(PersistableFeatureContainer):
         if fmt not in self.get_pixel_formats():
             raise ValueError('Camera does not support PixelFormat \'{}\''.format(str(fmt)))
 
-        feat = self.get_feature_by_name('PixelFormat')
+        feat = self._get_feature_by_name('PixelFormat')
         fmt_str = str(fmt).upper()
 
         for entry in feat.get_available_entries():
@@ -579,7 +595,8 @@ class Camera(PersistableFeatureContainer):
             stream.close()
 
         for feat in self._feats:
-            feat.unregister_all_change_handlers()
+            if feat._has_change_handlers():
+                feat.unregister_all_change_handlers()
 
         self._remove_feature_accessors()
 
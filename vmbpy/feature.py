@@ -26,8 +26,9 @@ OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import ctypes
 import inspect
+import sys
 import threading
-from typing import Callable, List, Optional, Tuple, Type, Union, cast
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union, cast
 
 from .c_binding import (FeatureFlags, FeatureVisibility, VmbBool, VmbCError, VmbDouble, VmbError,
                         VmbFeatureData, VmbFeatureEnumEntry, VmbFeatureInfo, VmbHandle, VmbInt64,
@@ -61,6 +62,36 @@ __all__ = [
 
 ChangeHandler = Callable[['FeatureTypes'], None]
 
+# Output buffers of VmbFeatureAccessQuery. They are reused for all features but kept per thread
+# since access modes might be queried concurrently.
+_access_query_buffers = threading.local()
+
+
+def _get_access_query_buffers() -> Tuple[VmbBool, VmbBool]:
+    try:
+        return _access_query_buffers.buffers
+
+    except AttributeError:
+        _access_query_buffers.buffers = (VmbBool(False), VmbBool(False))
+        return _access_query_buffers.buffers
+
+
+# Decoded feature flags by bit mask. Only a few distinct masks occur, so features share them.
+_feature_flags_cache: Dict[int, Tuple[FeatureFlags, ...]] = {}
+
+
+def _decode_feature_flags(val: int) -> Tuple[FeatureFlags, ...]:
+    # The feature flag could contain undocumented values at third bit.
+    # To prevent any issues, clear the third bit before decoding.
+    val &= ~4
+
+    flags = _feature_flags_cache.get(val)
+
+    if flags is None:
+        flags = _feature_flags_cache[val] = decode_flags(FeatureFlags, val)
+
+    return flags
+
 
 class _BaseFeature:
     """This class provides most basic feature access functionality.
@@ -68,15 +99,47 @@ class _BaseFeature:
     All FeatureType implementations must derive from BaseFeature.
     """
 
+    # A device exposes hundreds of features. Slots avoid a per instance __dict__. Subclasses must
+    # declare __slots__ as well.
+    __slots__ = ('_handle', '_info', '__name', '__category', '__display_name', '__unit',
+                 '__representation', '__tooltip', '__description', '__sfnc_namespace', '__flags',
+                 '__visibility', '__polling_time', '__is_streamable', '__has_selected_features',
+                 '__handlers', '__handlers_lock', '__handlers_snapshot', '__feature_callback',
+                 '__weakref__')
+
     def __init__(self,  handle: VmbHandle, info: VmbFeatureInfo):
         """Do not call directly. Access Features via System, Camera or Interface Types instead."""
         self._handle: VmbHandle = handle
         self._info: VmbFeatureInfo = info
 
+        # VmbFeatureInfo is not modified after feature discovery. Read and decode its fields only
+        # once instead of on each getter call.
+        # Names are interned since they are used as keys for feature lookups by name.
+        self.__name: str = sys.intern(decode_cstr(info.name))
+        self.__category: str = decode_cstr(info.category)
+        self.__display_name: str = decode_cstr(info.displayName)
+        self.__unit: str = decode_cstr(info.unit)
+        self.__representation: str = decode_cstr(info.representation)
+        self.__tooltip: str = decode_cstr(info.tooltip)
+        self.__description: str = decode_cstr(info.description)
+        self.__sfnc_namespace: str = decode_cstr(info.sfncNamespace)
+
+        self.__flags: Tuple[FeatureFlags, ...] = _decode_feature_flags(info.featureFlags)
+        self.__visibility: FeatureVisibility = FeatureVisibility(info.visibility)
+        self.__polling_time: int = info.pollingTime
+        self.__is_streamable: bool = info.isStreamable
+        self.__has_selected_features: bool = info.hasSelectedFeatures
+
         self.__handlers: List[ChangeHandler] = []
         self.__handlers_lock = threading.Lock()
 
-        self.__feature_callback = INVALIDATION_CALLBACK_TYPE(self.__feature_cb_wrapper)
+        # Immutable copy of the registered handlers. It is replaced under the lock on each change
+        # so that the invalidation callback can read it without locking.
+        self.__handlers_snapshot: Tuple[ChangeHandler, ...] = ()
+
+        # Most features never get a change handler. The ctypes callback is therefore only created
+        # on first registration and kept afterwards.
+        self.__feature_callback: Optional[Any] = None
 
     def __repr__(self):
         rep = 'Feature'
@@ -87,7 +150,7 @@ class _BaseFeature:
 
     def get_name(self) -> str:
         """Get Feature Name, e.g. 'DiscoveryInterfaceEvent'"""
-        return decode_cstr(self._info.name)
+        return self.__name
 
     def get_type(self) -> Type['_BaseFeature']:
         """Get Feature Type, e.g. ``IntFeature``"""
@@ -95,57 +158,51 @@ class _BaseFeature:
 
     def get_flags(self) -> Tuple[FeatureFlags, ...]:
         """Get a set of FeatureFlags, e.g. ``(FeatureFlags.Read, FeatureFlags.Write)``"""
-        val = self._info.featureFlags
-
-        # The feature flag could contain undocumented values at third bit.
-        # To prevent any issues, clear the third bit before decoding.
-        val &= ~4
-
-        return decode_flags(FeatureFlags, val)
+        return self.__flags
 
     def get_category(self) -> str:
         """Get Feature category, e.g. '/Discovery'"""
-        return decode_cstr(self._info.category)
+        return self.__category
 
     def get_display_name(self) -> str:
         """Get lengthy Feature name e.g. 'Discovery Interface Event'"""
-        return decode_cstr(self._info.displayName)
+        return self.__display_name
 
     def get_polling_time(self) -> int:
         """Predefined Polling Time for volatile features."""
-        return self._info.pollingTime
+        return self.__polling_time
 
     def get_unit(self) -> str:
         """Get unit of this Feature, e.g. 'dB' on Feature 'GainAutoMax'"""
-        return decode_cstr(self._info.unit)
+        return self.__unit
 
     def get_representation(self) -> str:
         """Representation of a numeric feature."""
-        return decode_cstr(self._info.representation)
+        return self.__representation
 
     def get_visibility(self) -> FeatureVisibility:
         """UI visibility of this feature"""
-        return FeatureVisibility(self._info.visibility)
+        return self.__visibility
 
     def get_tooltip(self) -> str:
         """Short Feature description."""
-        return decode_cstr(self._info.tooltip)
+        return self.__tooltip
 
     def get_description(self) -> str:
         """Long feature description."""
-        return decode_cstr(self._info.description)
+        return self.__description
 
     def get_sfnc_namespace(self) -> str:
         """Namespace of this feature"""
-        return decode_cstr(self._info.sfncNamespace)
+        return self.__sfnc_namespace
 
     def is_streamable(self) -> bool:
         """Indicates if a feature can be stored in /loaded from a file."""
-        return self._info.isStreamable
+        return self.__is_streamable
 
     def has_selected_features(self) -> bool:
         """Indicates if this feature selects other features."""
-        return self._info.hasSelectedFeatures
+        return self.__has_selected_features
 
     @TraceEnable()
     def get_access_mode(self) -> Tuple[bool, bool]:
@@ -155,8 +212,7 @@ class _BaseFeature:
             A pair of bool. In the first bool is ``True``, read access on this Feature is granted.
             If the second bool is ``True`` write access on this Feature is granted.
         """
-        c_read = VmbBool(False)
-        c_write = VmbBool(False)
+        c_read, c_write = _get_access_query_buffers()
 
         call_vmb_c('VmbFeatureAccessQuery', self._handle, self._info.name, byref(c_read),
                    byref(c_write))
@@ -211,12 +267,20 @@ class _BaseFeature:
             if len(self.__handlers) == 1:
                 self.__register_callback()
 
+            self.__handlers_snapshot = tuple(self.__handlers)
+
+    def _has_change_handlers(self) -> bool:
+        # Reads the snapshot without taking the lock. Allows to skip features without handlers
+        # when all handlers of a container are removed.
+        return bool(self.__handlers_snapshot)
+
     def unregister_all_change_handlers(self):
         """Remove all registered change handlers."""
         with self.__handlers_lock:
             if self.__handlers:
                 self.__unregister_callback()
                 self.__handlers.clear()
+                self.__handlers_snapshot = ()
 
     @RuntimeTypeCheckEnable()
     def unregister_change_handler(self, handler: ChangeHandler):
@@ -242,9 +306,13 @@ class _BaseFeature:
                 self.__unregister_callback()
 
             self.__handlers.remove(handler)
+            self.__handlers_snapshot = tuple(self.__handlers)
 
     @TraceEnable()
     def __register_callback(self):
+        if self.__feature_callback is None:
+            self.__feature_callback = INVALIDATION_CALLBACK_TYPE(self.__feature_cb_wrapper)
+
         call_vmb_c('VmbFeatureInvalidationRegister', self._handle, self._info.name,
                    self.__feature_callback, None)
 
@@ -255,19 +323,19 @@ class _BaseFeature:
 
     def __feature_cb_wrapper(self, *_):   # coverage: skip
         # Skip coverage because it can't be measured. This is called from C-Context.
-        with self.__handlers_lock:
-            for handler in self.__handlers:
-
-                try:
-                    handler(self)
-
-                except Exception as e:
-                    msg = 'Caught Exception in handler: '
-                    msg += 'Type: {}, '.format(type(e))
-                    msg += 'Value: {}, '.format(e)
-                    msg += 'raised by: {}'.format(handler)
-                    Log.get_instance().error(msg)
-                    raise e
+        # Handlers are executed on the current snapshot without taking the lock. This allows
+        # handlers to (un)register handlers and does not block registration from other threads.
+        for handler in self.__handlers_snapshot:
+            try:
+                handler(self)
+
+            except Exception as e:
+                msg = 'Caught Exception in handler: '
+                msg += 'Type: {}, '.format(type(e))
+                msg += 'Value: {}, '.format(e)
+                msg += 'raised by: {}'.format(handler)
+                Log.get_instance().error(msg)
+                raise e
 
     def _build_access_error(self) -> VmbFeatureError:
         caller_name = inspect.stack()[1][3]
@@ -293,6 +361,8 @@ class _BaseFeature:
 class BoolFeature(_BaseFeature):
     """The BoolFeature is a feature represented by a boolean value."""
 
+    __slots__ = ()
+
     @TraceEnable()
     def __init__(self, handle: VmbHandle, info: VmbFeatureInfo):
         """Do not call directly. Instead, access Features via System, Camera, or Interface Types."""
@@ -383,6 +453,8 @@ class CommandFeature(_BaseFeature):
     saving a user set.
     """
 
+    __slots__ = ()
+
     @TraceEnable()
     def __init__(self, handle: VmbHandle, info: VmbFeatureInfo):
         """Do not call directly. Instead, access Features via System, Camera, or Interface types."""
@@ -493,6 +565,8 @@ class EnumFeature(_BaseFeature):
     All possible values of an EnumFeature can be queried through the Feature itself.
     """
 
+    __slots__ = ('__entries_var',)
+
     @TraceEnable()
     def __init__(self, handle: VmbHandle, info: VmbFeatureInfo):
         """Do not call directly. Instead, access Features via System, Camera, or Interface Types."""
@@ -647,6 +721,8 @@ def _discover_enum_entries(handle: VmbHandle, feat_name: str) -> EnumEntryTuple:
 class FloatFeature(_BaseFeature):
     """The FloatFeature is a feature represented by a floating point number."""
 
+    __slots__ = ()
+
     @TraceEnable()
     def __init__(self, handle: VmbHandle, info: VmbFeatureInfo):
         """Do not call directly. Instead, access Features via System, Camera, or Interface Types."""
@@ -797,6 +873,8 @@ class FloatFeature(_BaseFeature):
 class IntFeature(_BaseFeature):
     """The IntFeature is a feature represented by an integer."""
 
+    __slots__ = ()
+
     @TraceEnable()
     def __init__(self, handle: VmbHandle, info: VmbFeatureInfo):
         """Do not call directly. Instead, access Features via System, Camera, or Interface Types."""
@@ -952,6 +1030,8 @@ class IntFeature(_BaseFeature):
 class RawFeature(_BaseFeature):
     """The RawFeature is a feature represented by sequence of bytes."""
 
+    __slots__ = ()
+
     @TraceEnable()
     def __init__(self, handle: VmbHandle, info: VmbFeatureInfo):
         """Do not call directly. Instead, access Features via System, Camera, or Interface Types."""
@@ -1063,6 +1143,8 @@ class RawFeature(_BaseFeature):
 class StringFeature(_BaseFeature):
     """The StringFeature is a feature represented by a string."""
 
+    __slots__ = ()
+
     @TraceEnable()
     def __init__(self, handle: VmbHandle, info: VmbFeatureInfo):
         """Do not call directly. Instead, access Features via System, Camera or Interface Types."""
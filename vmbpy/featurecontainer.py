@@ -25,14 +25,16 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import os
+import threading
 from ctypes import byref, sizeof
+from typing import Dict
 
 from .c_binding import (ModulePersistFlags, PersistType, VmbFeaturePersistSettings,
                         _as_vmb_file_path, call_vmb_c)
 from .error import VmbFeatureError
 from .feature import FeaturesTuple, FeatureTypes, FeatureTypeTypes, discover_features
-from .shared import (attach_feature_accessors, filter_features_by_category, filter_features_by_name,
-                     filter_features_by_type, filter_selected_features, remove_feature_accessors)
+from .shared import (attach_feature_accessors, filter_features_by_category, filter_features_by_type,
+                     filter_selected_features, remove_feature_accessors)
 from .util import RuntimeTypeCheckEnable, TraceEnable
 
 __all__ = [
@@ -43,6 +45,17 @@ __all__ = [
 ]
 
 
+# Size of the settings struct passed to VmbSettingsLoad and VmbSettingsSave
+_PERSIST_SETTINGS_SIZE = sizeof(VmbFeaturePersistSettings)
+
+# Required file extension of settings files
+_XML_SUFFIX = '.xml'
+
+# Settings struct reused by all load_settings/save_settings calls of a thread. All fields are set
+# before each call.
+_persist_settings = threading.local()
+
+
 class FeatureContainer:
     """This class provides access to VmbC features available via self._handle
 
@@ -52,16 +65,34 @@ class FeatureContainer:
     and attached as class members. Removing the attached features again is done via
     ``_remove_feature_accessors``. This should be done when the above mentioned context is left.
     """
+
+    # Known members are stored in slots. The __dict__ is kept for the attached feature accessors.
+    # Subclasses may declare __slots__ for their own members.
+    __slots__ = ('_handle', '_feats', '_feats_by_name', '__feats_by_type', '__feats_by_category',
+                 '__feats_selected_by', '__context_cnt', '__dict__', '__weakref__')
+
     @TraceEnable()
     def __init__(self) -> None:
         self._feats: FeaturesTuple = ()
+        # Index of `self._feats` by feature name. Used for fast lookups in `get_feature_by_name`
+        self._feats_by_name: Dict[str, FeatureTypes] = {}
+
+        # Results of `get_features_by_type`, `get_features_by_category` and
+        # `get_features_selected_by`. The discovered features and their selection relations do not
+        # change while the container is open, so filtering is only done once per key.
+        self.__feats_by_type: Dict[FeatureTypeTypes, FeaturesTuple] = {}
+        self.__feats_by_category: Dict[str, FeaturesTuple] = {}
+        self.__feats_selected_by: Dict[FeatureTypes, FeaturesTuple] = {}
 
         self.__context_cnt: int = 0
 
     @TraceEnable()
     def _attach_feature_accessors(self):
+        # Features are only discovered and attached when the first context is entered. Nested
+        # contexts reuse them and only increase the counter.
         if not self.__context_cnt:
             self._feats = discover_features(self._handle)
+            self._feats_by_name = {feat.get_name(): feat for feat in self._feats}
             attach_feature_accessors(self, self._feats)
 
         self.__context_cnt += 1
@@ -73,8 +104,11 @@ class FeatureContainer:
 
         if not self.__context_cnt:
             remove_feature_accessors(self, self._feats)
+            self._feats_by_name = {}
+            self.__feats_by_type = {}
+            self.__feats_by_category = {}
+            self.__feats_selected_by = {}
 
-    @TraceEnable()
     def get_all_features(self) -> FeaturesTuple:
         """Get access to all discovered features.
 
@@ -107,7 +141,13 @@ class FeatureContainer:
             VmbFeatureError:
                 If ``feat`` is not a valid feature.
         """
-        return filter_selected_features(self._feats, feat)
+        feats = self.__feats_selected_by.get(feat)
+
+        if feats is None:
+            feats = filter_selected_features(self._feats_by_name, feat)
+            self.__feats_selected_by[feat] = feats
+
+        return feats
 
     @TraceEnable()
     @RuntimeTypeCheckEnable()
@@ -130,7 +170,13 @@ class FeatureContainer:
             RuntimeError:
                 If called outside of ``with`` context.
         """
-        return filter_features_by_type(self._feats, feat_type)
+        feats = self.__feats_by_type.get(feat_type)
+
+        if feats is None:
+            feats = filter_features_by_type(self._feats, feat_type)
+            self.__feats_by_type[feat_type] = feats
+
+        return feats
 
     @TraceEnable()
     @RuntimeTypeCheckEnable()
@@ -150,7 +196,13 @@ class FeatureContainer:
             RuntimeError
                 If called outside of ``with`` context.
         """
-        return filter_features_by_category(self._feats, category)
+        feats = self.__feats_by_category.get(category)
+
+        if feats is None:
+            feats = filter_features_by_category(self._feats, category)
+            self.__feats_by_category[category] = feats
+
+        return feats
 
     @TraceEnable()
     @RuntimeTypeCheckEnable()
@@ -172,9 +224,14 @@ class FeatureContainer:
             VmbFeatureError:
                 If no feature is associated with ``feat_name``.
         """
-        feat = filter_features_by_name(self._feats, feat_name)
+        return self._get_feature_by_name(feat_name)
 
-        if not feat:
+    def _get_feature_by_name(self, feat_name: str) -> FeatureTypes:
+        # Undecorated lookup used by vmbpy itself. Callers must be inside the ``with`` context and
+        # pass a str.
+        feat = self._feats_by_name.get(feat_name)
+
+        if feat is None:
             raise VmbFeatureError('Feature \'{}\' not found.'.format(feat_name))
 
         return feat
@@ -182,6 +239,9 @@ class FeatureContainer:
 
 class PersistableFeatureContainer(FeatureContainer):
     """Inheriting from this class adds load/save settings methods to the subclass"""
+
+    __slots__ = ()
+
     @RuntimeTypeCheckEnable()
     def load_settings(self,
                       file_path: str,
@@ -213,13 +273,12 @@ class PersistableFeatureContainer(FeatureContainer):
             ValueError:
                 If argument path is no ".xml" file.
          """
-        if not file_path.endswith('.xml'):
-            raise ValueError('Given file \'{}\' must end with \'.xml\''.format(file_path))
+        _verify_xml_path(file_path)
 
         if not os.path.exists(file_path):
             raise ValueError('Given file \'{}\' does not exist.'.format(file_path))
 
-        settings = VmbFeaturePersistSettings()
+        settings = _get_persist_settings()
         settings.persistType = persist_type
         settings.persistFlag = persist_flags
         settings.maxIterations = max_iterations
@@ -228,7 +287,7 @@ class PersistableFeatureContainer(FeatureContainer):
                    self._handle,  # type: ignore
                    _as_vmb_file_path(file_path),
                    byref(settings),
-                   sizeof(settings))
+                   _PERSIST_SETTINGS_SIZE)
 
     @RuntimeTypeCheckEnable()
     def save_settings(self,
@@ -261,10 +320,9 @@ class PersistableFeatureContainer(FeatureContainer):
             ValueError:
                 If argument path is no ".xml"- File.
          """
-        if not file_path.endswith('.xml'):
-            raise ValueError('Given file \'{}\' must end with \'.xml\''.format(file_path))
+        _verify_xml_path(file_path)
 
-        settings = VmbFeaturePersistSettings()
+        settings = _get_persist_settings()
         settings.persistType = persist_type
         settings.persistFlag = persist_flags
         settings.maxIterations = max_iterations
@@ -273,4 +331,18 @@ class PersistableFeatureContainer(FeatureContainer):
                    self._handle,  # type: ignore
                    _as_vmb_file_path(file_path),
                    byref(settings),
-                   sizeof(settings))
+                   _PERSIST_SETTINGS_SIZE)
+
+
+def _verify_xml_path(file_path: str):
+    if not file_path.endswith(_XML_SUFFIX):
+        raise ValueError('Given file \'{}\' must end with \'{}\''.format(file_path, _XML_SUFFIX))
+
+
+def _get_persist_settings() -> VmbFeaturePersistSettings:
+    try:
+        return _persist_settings.settings
+
+    except AttributeError:
+        _persist_settings.settings = VmbFeaturePersistSettings()
+        return _persist_settings.settings
@@ -65,6 +65,10 @@ class InterfaceEvent(VmbIntEnum):
 class Interface(PersistableFeatureContainer):
     """This class allows access to an interface such as USB detected by VmbC."""
 
+    # FeatureContainer keeps a __dict__ since feature accessors are attached by name. The private
+    # attributes of the interface are stored in slots.
+    __slots__ = ('__transport_layer', '__info', '__id', '__name', '__type')
+
     @TraceEnable()
     def __init__(self, info: VmbInterfaceInfo, transport_layer: TransportLayer):
         """Do not call directly. Access Interfaces via ``vmbpy.VmbSystem`` instead."""
@@ -72,6 +76,12 @@ class Interface(PersistableFeatureContainer):
         self.__transport_layer = transport_layer
         self.__info: VmbInterfaceInfo = info
         self._handle: VmbHandle = self.__info.interfaceHandle
+
+        # The interface info does not change during the lifetime of the interface. Decode the
+        # reported values only once.
+        self.__id: str = decode_cstr(info.interfaceIdString)
+        self.__name: str = decode_cstr(info.interfaceName)
+        self.__type: TransportLayerType = TransportLayerType(info.interfaceType)
         self._open()
 
     @TraceEnable()
@@ -88,15 +98,11 @@ class Interface(PersistableFeatureContainer):
         return 'Interface(id={})'.format(self.get_id())
 
     def __repr__(self):
-        rep = 'Interface'
-        rep += '(_handle=' + repr(self._handle)
-        rep += ',__info=' + repr(self.__info)
-        rep += ')'
-        return rep
+        return 'Interface(_handle={!r},__info={!r})'.format(self._handle, self.__info)
 
     def get_id(self) -> str:
         """Get Interface Id such as 'VimbaUSBInterface_0x0'."""
-        return decode_cstr(self.__info.interfaceIdString)
+        return self.__id
 
     def get_type(self) -> TransportLayerType:
         """Get Interface Type such as ``TransportLayerType.GEV``.
@@ -106,11 +112,11 @@ class Interface(PersistableFeatureContainer):
             as there is no dedicated interface type enum. The ``TransportLayerType`` covers all
             interface types.
         """
-        return TransportLayerType(self.__info.interfaceType)
+        return self.__type
 
     def get_name(self) -> str:
         """Get Interface Name such as 'VimbaX USB Interface'."""
-        return decode_cstr(self.__info.interfaceName)
+        return self.__name
 
     @TraceEnable()
     @RuntimeTypeCheckEnable()
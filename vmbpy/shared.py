@@ -24,10 +24,11 @@ CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
 OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
-import itertools
+
+from typing import Dict
 
 from .c_binding import (VmbCError, VmbFeatureInfo, VmbHandle, VmbUint32, byref, call_vmb_c,
-                        create_string_buffer, sizeof)
+                        create_string_buffer, decode_cstr, sizeof, string_at)
 from .error import VmbFeatureError
 from .feature import FeaturesTuple, FeatureTypes, FeatureTypeTypes
 from .util import TraceEnable
@@ -45,23 +46,26 @@ __all__ = [
 
 
 @TraceEnable()
-def filter_selected_features(feats: FeaturesTuple, feat: FeatureTypes) -> FeaturesTuple:
+def filter_selected_features(feats_by_name: Dict[str, FeatureTypes],
+                             feat: FeatureTypes) -> FeaturesTuple:
     """Search for all Features selected by a given feature within a feature set.
 
     Arguments:
-        feats:
-            Feature set to search in.
+        feats_by_name:
+            Feature set to search in, indexed by feature name.
         feat:
-            Feature that might select Features within 'feats'.
+            Feature that might select Features within 'feats_by_name'.
 
     Returns:
         A set of all features that are selected by 'feat'.
 
     Raises:
         VmbFeatureError:
-            If 'feat' is not stored within 'feats'.
+            If 'feat' is not stored within 'feats_by_name'.
     """
-    if feat not in feats:
+    # The name index is used for both the membership test and the lookup of selected features
+    # instead of comparing all pairs.
+    if feats_by_name.get(feat.get_name()) is not feat:
         raise VmbFeatureError('Feature \'{}\' not in given Features'.format(feat.get_name()))
 
     result = []
@@ -82,8 +86,10 @@ def filter_selected_features(feats: FeaturesTuple, feat: FeatureTypes) -> Featur
                    byref(feats_found), sizeof(VmbFeatureInfo))
 
         # Search selected features in given feature set
-        for info, feature in itertools.product(feats_infos[:feats_found.value], feats):
-            if info.name == feature._info.name:
+        for info in feats_infos[:feats_found.value]:
+            feature = feats_by_name.get(decode_cstr(info.name))
+
+            if feature is not None:
                 result.append(feature)
 
     return tuple(result)
@@ -102,8 +108,7 @@ def filter_features_by_name(feats: FeaturesTuple, feat_name: str):
     Returns:
         The Feature with the name ``feat_name`` or ``None`` if lookup failed
     """
-    filtered = [feat for feat in feats if feat_name == feat.get_name()]
-    return filtered.pop() if filtered else None
+    return next((feat for feat in feats if feat_name == feat.get_name()), None)
 
 
 @TraceEnable()
@@ -215,7 +220,8 @@ def read_memory(handle: VmbHandle, addr: int, max_bytes: int) -> bytes:  # cover
         msg = 'Memory read access at {} failed with C-Error: {}.'
         raise ValueError(msg.format(hex(addr), repr(e.get_error_code()))) from e
 
-    return buf.raw[:bytesRead.value]
+    # Copy only the bytes that were actually read instead of the whole buffer.
+    return string_at(buf, bytesRead.value)
 
 
 @TraceEnable()
@@ -28,6 +28,7 @@ from __future__ import annotations
 
 import contextlib
 import copy
+import ctypes
 import threading
 from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple, cast
 
@@ -36,8 +37,7 @@ from .c_binding import (AccessMode, VmbCError, VmbError, VmbFrame, VmbHandle, Vm
 from .c_binding.vmb_c import FRAME_CALLBACK_TYPE
 from .error import VmbCameraError, VmbFeatureError, VmbSystemError, VmbTimeout
 from .featurecontainer import PersistableFeatureContainer
-from .frame import AllocationMode, Frame
-from .shared import filter_features_by_name
+from .frame import AllocationMode, Frame, FrameStatus
 from .util import (EnterContextOnCall, LeaveContextOnCall, Log, RaiseIfOutsideContext,
                    RuntimeTypeCheckEnable, TraceEnable)
 
@@ -141,7 +141,7 @@ class _StateAcquiring(_State):
             if not self.context.cam._disconnected:
                 # Skip Command execution on AccessMode.Read (required for Multicast Streaming)
                 if self.context.cam.get_access_mode() != AccessMode.Read:
-                    self.context.cam.get_feature_by_name('AcquisitionStart').run()
+                    self.context.cam._get_feature_by_name('AcquisitionStart').run()
             else:
                 raise VmbCameraError('Camera \'{}\' is not accessible to start the acquisition'
                                      ''.format(self.context.cam))
@@ -158,7 +158,7 @@ class _StateAcquiring(_State):
             if not self.context.cam._disconnected:
                 # Skip Command execution on AccessMode.Read (required for Multicast Streaming)
                 if self.context.cam.get_access_mode() != AccessMode.Read:
-                    self.context.cam.get_feature_by_name('AcquisitionStop').run()
+                    self.context.cam._get_feature_by_name('AcquisitionStop').run()
         except VmbCError as e:
             raise _build_camera_error(self.context.cam, self.context.stream, e) from e
         except BaseException as e:
@@ -277,8 +277,7 @@ def _frame_generator(cam: Camera,
     if stream.is_streaming():
         raise VmbCameraError('Operation not supported while streaming.')
 
-    buffer_alignment_feature = filter_features_by_name(stream.get_all_features(),
-                                                       'StreamBufferAlignment')
+    buffer_alignment_feature = stream._feats_by_name.get('StreamBufferAlignment')
     if buffer_alignment_feature:
         buffer_alignment = buffer_alignment_feature.get()
     else:
@@ -294,8 +293,7 @@ def _frame_generator(cam: Camera,
     # multiple frames but only used the frame at index 0 for actual data transmission for
     # synchronous acquisition
     buffer_count = 1
-    buffer_minimum_feature = filter_features_by_name(stream.get_all_features(),
-                                                     'StreamAnnounceBufferMinimum')
+    buffer_minimum_feature = stream._feats_by_name.get('StreamAnnounceBufferMinimum')
     if buffer_minimum_feature:
         buffer_minimum = buffer_minimum_feature.get()
         if not buffer_count >= buffer_minimum:
@@ -351,6 +349,13 @@ class Stream(PersistableFeatureContainer):
         self._parent_cam: Camera = parent_cam
         self._handle: VmbHandle = stream_handle
         self.__capture_fsm: Optional[_CaptureFsm] = None
+        # Capture fsm of the last streaming session if it was started with `reuse_frames`. Its
+        # frames stay announced after `stop_streaming` and are reused by the next call to
+        # `start_streaming` with `reuse_frames` if the requested buffers match. This avoids
+        # allocating and announcing all frame buffers on every restart of the stream. The frames
+        # are revoked when the stream is closed.
+        self.__idle_fsm: Optional[_CaptureFsm] = None
+        self.__reuse_frames: bool = False
         self.__is_open: bool = False
         if is_open:
             self.open()
@@ -363,7 +368,7 @@ class Stream(PersistableFeatureContainer):
             self.__is_open = True
 
         # Determine current PacketSize (GigE - only) is somewhere between 1500 bytes
-        feat = filter_features_by_name(self._feats, 'GVSPPacketSize')
+        feat = self._feats_by_name.get('GVSPPacketSize')
         if feat:
             try:
                 min_ = 1400
@@ -385,6 +390,8 @@ class Stream(PersistableFeatureContainer):
             self._remove_feature_accessors()
             self.__is_open = False
 
+        self.__revoke_idle_frames()
+
     @TraceEnable()
     @RaiseIfOutsideContext(msg=__msg)
     @RuntimeTypeCheckEnable()
@@ -433,7 +440,8 @@ class Stream(PersistableFeatureContainer):
     def start_streaming(self,
                         handler: FrameHandler,
                         buffer_count: int = 5,
-                        allocation_mode: AllocationMode = AllocationMode.AnnounceFrame):
+                        allocation_mode: AllocationMode = AllocationMode.AnnounceFrame,
+                        reuse_frames: bool = False):
         """See :func:`vmbpy.Camera.start_streaming`"""
         if buffer_count <= 0:
             raise ValueError('Given buffer_count {} must be positive'.format(buffer_count))
@@ -443,8 +451,7 @@ class Stream(PersistableFeatureContainer):
                                  ''.format(self, self._parent_cam.get_id()))
 
         # Setup capturing fsm
-        buffer_alignment_feature = filter_features_by_name(self.get_all_features(),
-                                                           'StreamBufferAlignment')
+        buffer_alignment_feature = self._feats_by_name.get('StreamBufferAlignment')
         if buffer_alignment_feature:
             buffer_alignment = buffer_alignment_feature.get()
         else:
@@ -457,8 +464,7 @@ class Stream(PersistableFeatureContainer):
         except VmbCError as e:
             raise _build_camera_error(self._parent_cam, self, e) from e
 
-        buffer_minimum_feature = filter_features_by_name(self.get_all_features(),
-                                                         'StreamAnnounceBufferMinimum')
+        buffer_minimum_feature = self._feats_by_name.get('StreamAnnounceBufferMinimum')
         if buffer_minimum_feature:
             buffer_minimum = buffer_minimum_feature.get()
             if not buffer_count >= buffer_minimum:
@@ -467,16 +473,34 @@ class Stream(PersistableFeatureContainer):
                 Log.get_instance().info(msg.format(buffer_minimum, buffer_count))
                 buffer_count = buffer_minimum
 
-        frames = tuple([Frame(payload_size.value,
-                              allocation_mode,
-                              buffer_alignment=buffer_alignment) for _ in range(buffer_count)])
         callback = FRAME_CALLBACK_TYPE(self.__frame_cb_wrapper)
 
-        self.__capture_fsm = _CaptureFsm(_Context(self._parent_cam,
-                                                  self,
-                                                  frames,
-                                                  handler,
-                                                  callback))
+        fsm = self.__idle_fsm
+
+        if reuse_frames and fsm is not None and _is_reusable(fsm.get_context().frames,
+                                                             payload_size.value,
+                                                             allocation_mode,
+                                                             buffer_alignment,
+                                                             buffer_count):
+            self.__idle_fsm = None
+            context = fsm.get_context()
+            context.frames_handler = handler
+            context.frames_callback = callback
+            for frame in context.frames:
+                # Mark frame as invalid until it has been used again
+                _frame_handle_accessor(frame).receiveStatus = FrameStatus.Invalid
+
+        else:
+            # Frames of the last session are not reused. Revoke them before announcing new ones
+            self.__revoke_idle_frames()
+
+            frames = tuple([Frame(payload_size.value,
+                                  allocation_mode,
+                                  buffer_alignment=buffer_alignment) for _ in range(buffer_count)])
+            fsm = _CaptureFsm(_Context(self._parent_cam, self, frames, handler, callback))
+
+        self.__capture_fsm = fsm
+        self.__reuse_frames = reuse_frames
 
         # Try to enter streaming mode. If this fails perform cleanup and raise error
         try:
@@ -492,12 +516,25 @@ class Stream(PersistableFeatureContainer):
         if not self.is_streaming():
             return
 
-        # Leave Capturing mode. If any error occurs, report it and cleanup
+        fsm = self.__capture_fsm
+        self.__capture_fsm = None
+
+        if not self.__reuse_frames:
+            # Leave Capturing mode and revoke all frames
+            fsm.leave_capturing_mode()
+            return
+
+        # Leave Capturing mode but keep the frames announced for the next streaming session. If
+        # any error occurs, revoke the frames, report the error and cleanup
         try:
-            self.__capture_fsm.leave_capturing_mode()
+            fsm.go_to_state(_StateAnnounced)
 
-        finally:
-            self.__capture_fsm = None
+        except BaseException:
+            with contextlib.suppress(VmbCError, VmbCameraError):
+                fsm.leave_capturing_mode()
+            raise
+
+        self.__idle_fsm = fsm
 
     @TraceEnable()
     def is_streaming(self) -> bool:
@@ -518,6 +555,16 @@ class Stream(PersistableFeatureContainer):
 
         self.__capture_fsm.queue_frame(frame)
 
+    def __revoke_idle_frames(self):
+        fsm = self.__idle_fsm
+        self.__idle_fsm = None
+
+        if fsm is not None:
+            # Errors are ignored here. Closing the camera releases all frames that are still
+            # announced anyway
+            with contextlib.suppress(VmbCError, VmbCameraError):
+                fsm.leave_capturing_mode()
+
     def __frame_cb_wrapper(self,
                            cam_handle: VmbHandle,
                            stream_handle: VmbHandle,
@@ -566,6 +613,26 @@ def _frame_handle_accessor(frame: Frame) -> VmbFrame:
     return frame._frame
 
 
+def _is_reusable(frames: FrameTuple,
+                 buffer_size: int,
+                 allocation_mode: AllocationMode,
+                 buffer_alignment: int,
+                 buffer_count: int) -> bool:
+    if len(frames) != buffer_count:
+        return False
+
+    for frame in frames:
+        if frame._allocation_mode != allocation_mode or frame.get_buffer_size() != buffer_size:
+            return False
+
+        # Buffers allocated by the Transport Layer are aligned by the Transport Layer itself
+        if allocation_mode == AllocationMode.AnnounceFrame and \
+           ctypes.addressof(frame.get_buffer()) % buffer_alignment != 0:
+            return False
+
+    return True
+
+
 def _build_camera_error(cam: Camera, stream: Stream, orig_exc: VmbCError) -> VmbCameraError:
     err = orig_exc.get_error_code()
 
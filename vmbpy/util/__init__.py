@@ -62,7 +62,11 @@ __all__ = [
 
     # Enums
     'VmbIntEnum',
-    'VmbFlagEnum'
+    'VmbFlagEnum',
+
+    # Functions
+    'enable_runtime_type_checks',
+    'runtime_type_checks_enabled'
 ]
 
 from .context_decorator import (EnterContextOnCall, LeaveContextOnCall, RaiseIfInsideContext,
@@ -75,6 +79,7 @@ from .log import (LOG_CONFIG_CRITICAL, LOG_CONFIG_CRITICAL_CONSOLE_ONLY,
                   LOG_CONFIG_INFO_FILE_ONLY, LOG_CONFIG_TRACE, LOG_CONFIG_TRACE_CONSOLE_ONLY,
                   LOG_CONFIG_TRACE_FILE_ONLY, LOG_CONFIG_WARNING, LOG_CONFIG_WARNING_CONSOLE_ONLY,
                   LOG_CONFIG_WARNING_FILE_ONLY, Log, LogConfig, LogLevel)
-from .runtime_type_check import RuntimeTypeCheckEnable
+from .runtime_type_check import (RuntimeTypeCheckEnable, enable_runtime_type_checks,
+                                 runtime_type_checks_enabled)
 from .scoped_log import ScopedLogEnable
 from .tracer import TraceEnable
@@ -151,6 +151,10 @@ class Log(logging.Logger):
         self.addHandler(logging.NullHandler())
         self.__config: Optional[LogConfig] = None
 
+        # Whether any handler other than a `NullHandler` was added by `enable`. It is checked on
+        # every traced call, so scanning the handlers each time is avoided.
+        self._output_enabled: bool = False
+
     @staticmethod
     def get_instance() -> 'Log':
         """Get Log instance."""
@@ -177,12 +181,14 @@ class Log(logging.Logger):
         for handler in config.get_handlers():
             self.addHandler(handler)
         self.__config = config
+        self._output_enabled = not all(isinstance(h, logging.NullHandler) for h in self.handlers)
 
     def disable(self):
         for handler in list(self.handlers):
             if not isinstance(handler, logging.NullHandler):
                 self.removeHandler(handler)
         self.__config = None
+        self._output_enabled = False
 
     def get_config(self) -> Optional[LogConfig]:
         """ Get log configuration
@@ -25,17 +25,62 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 import collections.abc
+import os
 from functools import wraps
-from inspect import isfunction, ismethod, signature
-from typing import Union, get_type_hints
+from inspect import Parameter, isfunction, ismethod, signature
+from typing import Any, Tuple, Union, get_type_hints
+from weakref import WeakKeyDictionary
 
 from .log import Log
 
 __all__ = [
-    'RuntimeTypeCheckEnable'
+    'RuntimeTypeCheckEnable',
+    'enable_runtime_type_checks',
+    'runtime_type_checks_enabled'
 ]
 
 
+# Checks are performed unless disabled via RuntimeTypeCheckEnable.disable().
+_enabled: bool = True
+
+# Setting VMBPY_FAST=1 before import applies no checks at all. Decorated callables are left
+# unwrapped, which saves the wrapper call but cannot be undone via RuntimeTypeCheckEnable.enable().
+_pass_through: bool = os.environ.get('VMBPY_FAST') == '1'
+
+# Parameter kinds of checked callables. Bound methods are created on each attribute access, so
+# their underlying function is used as key. Entries are removed if the function is collected.
+_param_kinds_cache: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def _get_param_kinds(func) -> Tuple[Any, ...]:
+    try:
+        return _param_kinds_cache[func]
+
+    except KeyError:
+        kinds = tuple(p.kind for p in signature(func).parameters.values())
+        _param_kinds_cache[func] = kinds
+
+    except TypeError:
+        # Not weak referenceable (e.g. builtins). Inspect without caching.
+        kinds = tuple(p.kind for p in signature(func).parameters.values())
+
+    return kinds
+
+
+def _count_params(arg) -> int:
+    if not ismethod(arg):
+        return len(_get_param_kinds(arg))
+
+    # Binding consumes the first parameter of the underlying function unless it is *args. This
+    # matches the signature inspect reports for bound methods.
+    kinds = _get_param_kinds(arg.__func__)
+
+    if kinds and kinds[0] != Parameter.VAR_POSITIONAL:
+        return len(kinds) - 1
+
+    return len(kinds)
+
+
 class RuntimeTypeCheckEnable:
     """Decorator adding runtime type checking to the wrapped callable.
 
@@ -43,16 +88,67 @@ class RuntimeTypeCheckEnable:
     hints. If all checks are passed, the wrapped function is executed, if the given arguments to not
     match a TypeError is raised.
 
+    Checking can be switched off globally via RuntimeTypeCheckEnable.disable(). Decorated
+    callables then execute the wrapped callable directly without inspecting their arguments. If the
+    environment variable ``VMBPY_FAST`` is set to ``1`` on import, callables are not wrapped at all.
+
     Note:
         This decorator is no replacement for a feature complete TypeChecker. It supports only a
         subset of all types expressible by type hints.
     """
     _log = Log.get_instance()
 
+    @staticmethod
+    def enable():
+        """Enable runtime type checks of all decorated callables. This is the default.
+
+        Has no effect if ``VMBPY_FAST=1`` was set on import, since callables were not wrapped.
+        """
+        global _enabled
+        _enabled = True
+
+        if _pass_through:
+            msg = 'Runtime type checks can not be enabled: VMBPY_FAST=1 was set on import.'
+            RuntimeTypeCheckEnable._log.warning(msg)
+
+    @staticmethod
+    def disable():
+        """Disable runtime type checks of all decorated callables.
+
+        Arguments of wrong type are no longer reported with a TypeError but passed on as they are.
+        Use this only for code that is known to call vmbpy correctly.
+        """
+        global _enabled
+        _enabled = False
+
+    @staticmethod
+    def is_enabled() -> bool:
+        """Return True if runtime type checks are performed, False otherwise."""
+        return _enabled and not _pass_through
+
     def __call__(self, func):
+        if _pass_through:
+            return func
+
+        # Signature and type hints are looked up on first call and reused afterwards. This can't
+        # be done on decoration because hints may refer to types that are not yet defined.
+        sig = None
+        hints = None
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            full_args, hints = self.__dismantle_sig(func, *args, **kwargs)
+            nonlocal sig, hints
+
+            if not _enabled:
+                return func(*args, **kwargs)
+
+            if hints is None:
+                sig, hints = self.__dismantle_sig(func)
+
+            # Get merge args, kwargs and defaults to complete argument list.
+            full_args = sig.bind(*args, **kwargs)
+            full_args.apply_defaults()
+            full_args = full_args.arguments
 
             for arg_name in hints:
                 self.__verify_arg(func, hints[arg_name], (arg_name, full_args[arg_name]))
@@ -61,10 +157,8 @@ class RuntimeTypeCheckEnable:
 
         return wrapper
 
-    def __dismantle_sig(self, func, *args, **kwargs):
-        # Get merge args, kwargs and defaults to complete argument list.
-        full_args = signature(func).bind(*args, **kwargs)
-        full_args.apply_defaults()
+    def __dismantle_sig(self, func):
+        sig = signature(func)
 
         # Get available type hints, remove return value.
         while hasattr(func, '__wrapped__'):
@@ -74,7 +168,7 @@ class RuntimeTypeCheckEnable:
         hints = get_type_hints(func)
         hints.pop('return', None)
 
-        return (full_args.arguments, hints)
+        return (sig, hints)
 
     def __verify_arg(self, func, type_hint, arg_spec):
         arg_name, arg = arg_spec
@@ -108,7 +202,8 @@ class RuntimeTypeCheckEnable:
             return self.__matches_callable(type_hint, arg)
 
     def __matches_base_types(self, type_hint, arg) -> bool:
-        return type_hint == type(arg)
+        # Identity check is sufficient here: a hint only matches if it is the exact class of arg
+        return type(arg) is type_hint
 
     def __matches_type_types(self, type_hint, arg) -> bool:
         try:
@@ -217,11 +312,33 @@ class RuntimeTypeCheckEnable:
                 return False
 
         # Examine signature of given callable
-        sig_args = signature(arg).parameters
         hint_args = type_hint.__args__
 
         # Verify Parameter list length
-        if len(sig_args) != len(hint_args[:-1]):
+        if _count_params(arg) != len(hint_args[:-1]):
             return False
 
         return True
+
+
+def enable_runtime_type_checks(enable: bool = True):
+    """Enable or disable runtime type checks of all vmbpy functions and methods.
+
+    Checks are enabled by default. While disabled, arguments of wrong type are no longer reported
+    with a TypeError but passed on as they are. Use this only for code that is known to call vmbpy
+    correctly. Checks can not be enabled if ``VMBPY_FAST=1`` was set on import.
+
+    Arguments:
+        enable:
+            ``True`` to enable runtime type checks, ``False`` to disable them.
+    """
+    if enable:
+        RuntimeTypeCheckEnable.enable()
+
+    else:
+        RuntimeTypeCheckEnable.disable()
+
+
+def runtime_type_checks_enabled() -> bool:
+    """Return ``True`` if runtime type checks are performed, ``False`` otherwise."""
+    return RuntimeTypeCheckEnable.is_enabled()
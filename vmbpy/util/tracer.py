@@ -25,96 +25,100 @@ OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 """
 
-from functools import reduce, wraps
-from inspect import signature
-from logging import NullHandler
+import os
+import threading
 
-from .log import Log
+from functools import wraps
+from inspect import Signature, signature
+from typing import Optional, Tuple
+
+from .log import Log, LogLevel
 
 __all__ = [
     'TraceEnable'
 ]
 
 
-_FMT_MSG_ENTRY: str = 'Enter | {}'
-_FMT_MSG_LEAVE: str = 'Leave | {}'
-_FMT_MSG_RAISE: str = 'Raise | {}, {}'
-_FMT_ERROR: str = 'ErrorType: {}, ErrorValue: {}'
+_FMT_MSG_ENTRY: str = 'Enter | {}{}{}'
+_FMT_MSG_LEAVE: str = 'Leave | {}{}'
+_FMT_MSG_RAISE: str = 'Raise | {}{}, ErrorType: {}, ErrorValue: {}'
 _INDENT_PER_LEVEL: str = '  '
 
+# Indentations of common nesting levels, built once instead of on each trace message.
+_INDENTS: Tuple[str, ...] = tuple(_INDENT_PER_LEVEL * level for level in range(32))
+
+# Nesting level of traced calls. Kept per thread, since callbacks from VmbC are traced on threads
+# of their own while user code is traced concurrently.
+_trace_state = threading.local()
+
+# With VMBPY_FAST=1 set before import, functions are not wrapped and never show up in trace logs.
+_pass_through: bool = os.environ.get('VMBPY_FAST') == '1'
 
-def _args_to_str(func, *args, **kwargs) -> str:
+
+def _args_to_str(sig: Signature, *args, **kwargs) -> str:
     # Expand function signature
-    sig = signature(func).bind(*args, **kwargs)
-    sig.apply_defaults()
-    full_args = sig.arguments
+    bound = sig.bind(*args, **kwargs)
+    bound.apply_defaults()
+    full_args = bound.arguments
 
     # Early return if there is nothing to print
     if not full_args:
         return '(None)'
 
-    def fold(args_as_str: str, arg):
-        name, value = arg
-
-        if name == 'self':
-            arg_str = 'self'
+    args_str = ', '.join('self' if name == 'self' else str(value)
+                         for name, value in full_args.items())
 
-        else:
-            arg_str = str(value)
-
-        return '{}{}, '.format(args_as_str, arg_str)
-
-    return '({})'.format(reduce(fold, full_args.items(), '')[:-2])
+    return '({})'.format(args_str)
 
 
 def _get_indent(level: int) -> str:
-    return _INDENT_PER_LEVEL * level
+    try:
+        return _INDENTS[level]
+
+    except IndexError:
+        return _INDENT_PER_LEVEL * level
 
 
 def _create_enter_msg(name: str, level: int, args_str: str) -> str:
-    msg = '{}{}{}'.format(_get_indent(level), name, args_str)
-    return _FMT_MSG_ENTRY.format(msg)
+    return _FMT_MSG_ENTRY.format(_get_indent(level), name, args_str)
 
 
-def _create_leave_msg(name: str, level: int, ) -> str:
-    msg = '{}{}'.format(_get_indent(level), name)
-    return _FMT_MSG_LEAVE.format(msg)
+def _create_leave_msg(name: str, level: int) -> str:
+    return _FMT_MSG_LEAVE.format(_get_indent(level), name)
 
 
 def _create_raise_msg(name: str, level: int,  exc_type: Exception, exc_value: str) -> str:
-    msg = '{}{}'.format(_get_indent(level), name)
-    exc = _FMT_ERROR.format(exc_type, exc_value)
-    return _FMT_MSG_RAISE.format(msg, exc)
+    return _FMT_MSG_RAISE.format(_get_indent(level), name, exc_type, exc_value)
 
 
 class _Tracer:
     __log = Log.get_instance()
-    __level: int = 0
 
     @staticmethod
     def is_log_enabled() -> bool:
         # If there are any handler registered that are not `NullHandler`s logging is considered to
-        # be enabled
-        return not all([isinstance(handler, NullHandler) for handler in _Tracer.__log.handlers])
-
-    def __init__(self, func, *args, **kwargs):
-        self.__full_name: str = '{}.{}'.format(func.__module__, func.__qualname__)
-        self.__full_args: str = _args_to_str(func, *args, **kwargs)
+        # be enabled. The Log keeps track of that in `Log.enable` and `Log.disable`.
+        return _Tracer.__log._output_enabled
 
-    def __enter__(self):
-        msg = _create_enter_msg(self.__full_name, _Tracer.__level, self.__full_args)
+    @staticmethod
+    def enter(full_name: str, sig: Signature, args, kwargs):
+        level = getattr(_trace_state, 'level', 0)
+        args_str = _args_to_str(sig, *args, **kwargs)
+        msg = _create_enter_msg(full_name, level, args_str)
 
         _Tracer.__log.trace(msg)
-        _Tracer.__level += 1
+        _trace_state.level = level + 1
 
-    def __exit__(self, exc_type, exc_value, exc_traceback):
-        _Tracer.__level -= 1
+    @staticmethod
+    def leave(full_name: str, exc: Optional[BaseException] = None):
+        level = getattr(_trace_state, 'level', 1) - 1
+        _trace_state.level = level
 
-        if exc_type:
-            msg = _create_raise_msg(self.__full_name, _Tracer.__level, exc_type, exc_value)
+        if exc is not None:
+            msg = _create_raise_msg(full_name, level, type(exc), exc)
 
         else:
-            msg = _create_leave_msg(self.__full_name, _Tracer.__level)
+            msg = _create_leave_msg(full_name, level)
 
         # TODO: when only python versions >=3.8 are supported, add stacklevel parameter here to
         # report correct line numbers in trace logs
@@ -125,17 +129,41 @@ class TraceEnable:
     """Decorator: Adds an entry of LogLevel. Trace on entry and exit of the wrapped function.
     On exit, the log entry contains information if the function was left normally or with an
     exception.
+
+    If the environment variable ``VMBPY_FAST`` is set to ``1`` on import, functions are returned
+    unwrapped and cannot be traced.
     """
     def __call__(self, func):
+        if _pass_through:
+            return func
+
+        log = Log.get_instance()
+        full_name = '{}.{}'.format(func.__module__, func.__qualname__)
+        sig: Optional[Signature] = None
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if _Tracer.is_log_enabled():
-                with _Tracer(func, *args, **kwargs):
-                    result = func(*args, **kwargs)
+            # Checked on each call since logging can be enabled at any time. The trace messages
+            # are only built if they can be emitted.
+            if not (log._output_enabled and log.isEnabledFor(LogLevel.Trace)):
+                return func(*args, **kwargs)
 
-                return result
+            # The signature of the wrapped function does not change. Inspect it on the first traced
+            # call only instead of on every call.
+            nonlocal sig
+            if sig is None:
+                sig = signature(func)
 
-            else:
-                return func(*args, **kwargs)
+            _Tracer.enter(full_name, sig, args, kwargs)
+
+            try:
+                result = func(*args, **kwargs)
+
+            except BaseException as e:
+                _Tracer.leave(full_name, e)
+                raise
+
+            _Tracer.leave(full_name)
+            return result
 
         return wrapper
@@ -31,7 +31,8 @@ from typing import List, Optional
 
 from . import __version__ as VMBPY_VERSION
 from .c_binding import (G_VMB_C_HANDLE, VMB_C_VERSION, VMB_IMAGE_TRANSFORM_VERSION, VmbCError,
-                        VmbError, VmbHandle, VmbUint32, _as_vmb_file_path, call_vmb_c)
+                        VmbError, VmbHandle, VmbUint32, _as_vmb_file_path, call_vmb_c,
+                        decode_cstr)
 from .camera import (Camera, CameraChangeHandler, CameraEvent, CamerasList, CamerasTuple,
                      VmbCameraInfo)
 from .error import VmbCameraError, VmbInterfaceError, VmbSystemError, VmbTransportLayerError
@@ -49,6 +50,13 @@ __all__ = [
 ]
 
 
+# Initial length of the list passed to VmbInterfacesList during interface discovery
+_INTERFACES_LIST_LENGTH = 16
+
+# Size of a single list entry as expected by VmbInterfacesList
+_INTERFACE_INFO_SIZE = sizeof(VmbInterfaceInfo)
+
+
 class VmbSystem:
     class __Impl(FeatureContainer):
         """This class allows access to the entire Vimba X System.
@@ -276,12 +284,12 @@ class VmbSystem:
                     If interface with ``id_`` can't be found.
             """
             with self.__inters_lock:
-                inter = [inter for inter in self.__inters.values() if id_ == inter.get_id()]
+                inter = next((i for i in self.__inters.values() if id_ == i.get_id()), None)
 
-            if not inter:
+            if inter is None:
                 raise VmbInterfaceError('Interface with ID \'{}\' not found.'.format(id_))
 
-            return inter.pop()
+            return inter
 
         @RaiseIfOutsideContext()
         @RuntimeTypeCheckEnable()
@@ -512,10 +520,10 @@ class VmbSystem:
 
             self._attach_feature_accessors()
 
-            feat = self.get_feature_by_name('EventInterfaceDiscovery')
+            feat = self._get_feature_by_name('EventInterfaceDiscovery')
             feat.register_change_handler(self.__inter_cb_wrapper)
 
-            feat = self.get_feature_by_name('EventCameraDiscovery')
+            feat = self._get_feature_by_name('EventCameraDiscovery')
             feat.register_change_handler(self.__cam_cb_wrapper)
 
             self.__transport_layers = self.__discover_transport_layers()
@@ -529,7 +537,8 @@ class VmbSystem:
             self.unregister_all_interface_change_handlers()
 
             for feat in self._feats:
-                feat.unregister_all_change_handlers()
+                if feat._has_change_handlers():
+                    feat.unregister_all_change_handlers()
 
             self._remove_feature_accessors()
             self.__cams_handlers = []
@@ -546,9 +555,9 @@ class VmbSystem:
 
         def __cam_cb_wrapper(self, _):   # coverage: skip
             # Skip coverage because it can't be measured. This is called from C-Context
-            event = CameraEvent(int(self.get_feature_by_name('EventCameraDiscoveryType').get()))
+            event = CameraEvent(int(self._get_feature_by_name('EventCameraDiscoveryType').get()))
             cam = None
-            cam_id = self.get_feature_by_name('EventCameraDiscoveryCameraID').get()
+            cam_id = self._get_feature_by_name('EventCameraDiscoveryCameraID').get()
             log = Log.get_instance()
 
             # New camera found: Add it to camera list
@@ -604,15 +613,21 @@ class VmbSystem:
 
         def __inter_cb_wrapper(self, _):   # coverage: skip
             # Skip coverage because it can't be measured. This is called from C-Context
-            event = InterfaceEvent(int(self.get_feature_by_name('EventInterfaceDiscoveryType').get()))  # noqa: E501
+            event = InterfaceEvent(int(self._get_feature_by_name('EventInterfaceDiscoveryType').get()))  # noqa: E501
             inter = None
-            inter_id = self.get_feature_by_name('EventInterfaceDiscoveryInterfaceID').get()
+            inter_id = self._get_feature_by_name('EventInterfaceDiscoveryInterfaceID').get()
             log = Log.get_instance()
 
             # New interface found: Add it to interface list
             if event == InterfaceEvent.Detected:
                 inter = self.__discover_interface(inter_id)
 
+                # Do not raise into the C-Context. The interface may have been lost again already.
+                if inter is None:
+                    msg = 'Failed to add interface \"{}\" to active interfaces'
+                    log.error(msg.format(inter_id))
+                    return
+
                 with self.__inters_lock:
                     self.__inters[inter._get_handle()] = inter
 
@@ -621,9 +636,9 @@ class VmbSystem:
             # Existing interface lost. Remove it from active interfaces
             elif event == InterfaceEvent.Missing:
                 with self.__inters_lock:
-                    inter_list = [i for i in self.__inters.values() if inter_id == i.get_id()]
-                    if inter_list:
-                        inter = inter_list.pop()
+                    inters = self.__inters.values()
+                    inter = next((i for i in inters if inter_id == i.get_id()), None)
+                    if inter is not None:
                         del self.__inters[inter._get_handle()]
 
                         log.info('Removed interface \"{}\" from active interfaces'.format(inter_id))
@@ -675,41 +690,67 @@ class VmbSystem:
 
             return result
 
+        @TraceEnable()
+        def __list_interface_infos(self) -> List[VmbInterfaceInfo]:
+            """Do not call directly. Access Interfaces via vmbpy.VmbSystem instead."""
+            inters_found = VmbUint32(0)
+
+            # Provide room for a typical number of interfaces, so that usually a single call to
+            # VmbInterfacesList is sufficient. Otherwise VmbC reports the number of available
+            # interfaces and the query is repeated with a list that is large enough.
+            inters_count = _INTERFACES_LIST_LENGTH
+
+            while True:
+                inters_infos = (VmbInterfaceInfo * inters_count)()
+
+                try:
+                    call_vmb_c('VmbInterfacesList', inters_infos, inters_count,
+                               byref(inters_found), _INTERFACE_INFO_SIZE)
+                    break
+
+                except VmbCError as e:
+                    if e.get_error_code() != VmbError.MoreData:
+                        raise
+
+                    inters_count = inters_found.value
+
+            return inters_infos[:min(inters_found.value, inters_count)]
+
         @TraceEnable()
         def __discover_interfaces(self) -> InterfacesDict:
             """Do not call directly. Access Interfaces via vmbpy.VmbSystem instead."""
 
             result = {}
-            inters_count = VmbUint32(0)
 
-            call_vmb_c('VmbInterfacesList', None, 0, byref(inters_count), sizeof(VmbInterfaceInfo))
+            for info in self.__list_interface_infos():
+                try:
+                    result[info.interfaceHandle] = Interface(
+                        info, self.__transport_layers[info.transportLayerHandle])
+                except Exception as e:
+                    msg = 'Failed to create Interface for {}: {}'
+                    msg = msg.format(info.interfaceName, e)
+                    Log.get_instance().error(msg)
 
-            if inters_count:
-                inters_found = VmbUint32(0)
-                inters_infos = (VmbInterfaceInfo * inters_count.value)()
+            return result
 
-                call_vmb_c('VmbInterfacesList', inters_infos, inters_count, byref(inters_found),
-                           sizeof(VmbInterfaceInfo))
+        @TraceEnable()
+        def __discover_interface(self, id_: str) -> Optional[Interface]:
+            """Do not call directly. Access Interfaces via vmbpy.VmbSystem instead."""
 
-                for info in inters_infos[:inters_found.value]:
+            # Since there is no function to query a single interface, list all interfaces and
+            # only create the Interface with the matching ID. Returns None if the interface is not
+            # listed or can't be created.
+            for info in self.__list_interface_infos():
+                if decode_cstr(info.interfaceIdString) == id_:
                     try:
-                        result[info.interfaceHandle] = Interface(
-                            info, self.__transport_layers[info.transportLayerHandle])
+                        return Interface(info, self.__transport_layers[info.transportLayerHandle])
                     except Exception as e:
                         msg = 'Failed to create Interface for {}: {}'
                         msg = msg.format(info.interfaceName, e)
                         Log.get_instance().error(msg)
+                        return None
 
-            return result
-
-        @TraceEnable()
-        def __discover_interface(self, id_: str) -> Interface:
-            """Do not call directly. Access Interfaces via vmbpy.VmbSystem instead."""
-
-            # Since there is no function to query a single interface, discover all interfaces and
-            # extract the Interface with the matching ID.
-            inters = self.__discover_interfaces().values()
-            return [i for i in inters if id_ == i.get_id()].pop()
+            return None
 
         @TraceEnable()
         def __discover_cameras(self) -> CamerasList: